@@ -49,39 +49,56 @@ class EnglishAssembler(object):
             is a single string consisting of one or more sentences with
             periods at the end.
         """
-        stmt_strs = []
-        for stmt in self.statements:
-            if isinstance(stmt, ist.Modification):
-                stmt_strs.append(_assemble_modification(stmt))
-            elif isinstance(stmt, ist.Autophosphorylation):
-                stmt_strs.append(_assemble_autophosphorylation(stmt))
-            elif isinstance(stmt, ist.Association):
-                stmt_strs.append(_assemble_association(stmt))
-            elif isinstance(stmt, ist.Complex):
-                stmt_strs.append(_assemble_complex(stmt))
-            elif isinstance(stmt, ist.Influence):
-                stmt_strs.append(_assemble_influence(stmt))
-            elif isinstance(stmt, ist.RegulateActivity):
-                stmt_strs.append(_assemble_regulate_activity(stmt))
-            elif isinstance(stmt, ist.RegulateAmount):
-                stmt_strs.append(_assemble_regulate_amount(stmt))
-            elif isinstance(stmt, ist.ActiveForm):
-                stmt_strs.append(_assemble_activeform(stmt))
-            elif isinstance(stmt, ist.Translocation):
-                stmt_strs.append(_assemble_translocation(stmt))
-            elif isinstance(stmt, ist.Gef):
-                stmt_strs.append(_assemble_gef(stmt))
-            elif isinstance(stmt, ist.Gap):
-                stmt_strs.append(_assemble_gap(stmt))
-            elif isinstance(stmt, ist.Conversion):
-                stmt_strs.append(_assemble_conversion(stmt))
-            else:
-                logger.warning('Unhandled statement type: %s.' % type(stmt))
+        stmt_strs = [stmt_str for stmt_str in self.make_model_sentences()
+                     if stmt_str]
         if stmt_strs:
             return ' '.join(stmt_strs)
         else:
             return ''
 
+    def make_model_sentences(self):
+        """Assemble text for each of the collected INDRA Statements.
+
+        Returns
+        -------
+        stmt_strs : list[str]
+            A list of sentences, one for each Statement in the same order as
+            the statements of the assembler. The sentence corresponding to
+            a Statement whose type is not handled is an empty string.
+        """
+        return [_assemble_statement(stmt) for stmt in self.statements]
+
+
+def _assemble_statement(stmt):
+    """Assemble a single Statement into a sentence."""
+    if isinstance(stmt, ist.Modification):
+        return _assemble_modification(stmt)
+    elif isinstance(stmt, ist.Autophosphorylation):
+        return _assemble_autophosphorylation(stmt)
+    elif isinstance(stmt, ist.Association):
+        return _assemble_association(stmt)
+    elif isinstance(stmt, ist.Complex):
+        return _assemble_complex(stmt)
+    elif isinstance(stmt, ist.Influence):
+        return _assemble_influence(stmt)
+    elif isinstance(stmt, ist.RegulateActivity):
+        return _assemble_regulate_activity(stmt)
+    elif isinstance(stmt, ist.RegulateAmount):
+        return _assemble_regulate_amount(stmt)
+    elif isinstance(stmt, ist.ActiveForm):
+        return _assemble_activeform(stmt)
+    elif isinstance(stmt, ist.Translocation):
+        return _assemble_translocation(stmt)
+    elif isinstance(stmt, ist.Gef):
+        return _assemble_gef(stmt)
+    elif isinstance(stmt, ist.Gap):
+        return _assemble_gap(stmt)
+    elif isinstance(stmt, ist.Conversion):
+        return _assemble_conversion(stmt)
+    else:
+        logger.warning('Unhandled statement type: %s.' % type(stmt))
+        return ''
+
 
 def _assemble_agent_str(agent):
     """Assemble an Agent object to text."""
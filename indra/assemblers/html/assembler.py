@@ -5,11 +5,14 @@ supports curation.
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import dict, str
 
-import re
 import uuid
-import itertools
+from operator import itemgetter
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
 from os.path import abspath, dirname, join
-from jinja2 import Template
+from jinja2 import Environment, FileSystemLoader
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,11 +24,19 @@ from indra.util.statement_presentation import group_and_sort_statements,\
     make_string_from_sort_key
 
 
-# Create a template object from the template file, load once
-template_path = join(dirname(abspath(__file__)), 'template.html')
-with open(template_path, 'rt') as f:
-    template_str = f.read()
-    template = Template(template_str)
+# Create a template object from the template file, load once. The template
+# is loaded through an Environment so that any templates it includes are also
+# compiled only once and cached.
+template_dir = dirname(abspath(__file__))
+template_path = join(template_dir, 'template.html')
+env = Environment(loader=FileSystemLoader(template_dir), auto_reload=False,
+                  cache_size=-1)
+template = env.get_template('template.html')
+
+# Agents of Statements of these types are all tagged with the 'other' role
+# rather than as subject and object
+_other_role_types = (Complex, SelfModification, ActiveForm, Conversion,
+                     Translocation)
 
 
 class HtmlAssembler(object):
@@ -113,7 +124,33 @@ class HtmlAssembler(object):
         str
             The assembled HTML as a string.
         """
-        stmts_formatted = []
+        self.model = template.render(**self._get_template_kwargs())
+        return self.model
+
+    def _get_template_kwargs(self):
+        """Return the keyword arguments used to render the template."""
+        metadata = {_format_metadata_key(k): v
+                    for k, v in self.metadata.items()}
+        if self.db_rest_url and not self.db_rest_url.endswith('statements'):
+            db_rest_url = self.db_rest_url + '/statements'
+        else:
+            db_rest_url = '.'
+        # The rows of Statements are generated lazily as the template is
+        # rendered
+        return dict(stmt_data=self._iter_stmt_rows(), metadata=metadata,
+                    title=self.title, db_rest_url=db_rest_url,
+                    other_scripts=self.other_scripts,
+                    ev_element=self.ev_element)
+
+    def _iter_stmt_rows(self):
+        """Generate the formatted rows of grouped Statements."""
+        # Assemble the English sentences for all the Statements at once
+        ea = EnglishAssembler(self.statements)
+        englishes = {stmt.get_hash(shallow=True): english for stmt, english
+                     in zip(self.statements, ea.make_model_sentences())}
+        # Agent URLs are cached since the same agents appear in many
+        # Statements
+        url_cache = {}
         stmt_rows = group_and_sort_statements(self.statements,
                                               self.ev_totals if self.ev_totals else None)
         for key, verb, stmts in stmt_rows:
@@ -122,7 +159,9 @@ class HtmlAssembler(object):
             for stmt in stmts:
                 stmt_hash = stmt.get_hash(shallow=True)
                 ev_list = self._format_evidence_text(stmt)
-                english = self._format_stmt_text(stmt)
+                english = self._format_stmt_text(stmt,
+                                                 englishes.get(stmt_hash),
+                                                 url_cache)
                 if self.ev_totals:
                     total_evidence = self.ev_totals.get(int(stmt_hash), '?')
                     if total_evidence == '?':
@@ -138,19 +177,7 @@ class HtmlAssembler(object):
                     'evidence_count': evidence_count_str})
             short_name = make_string_from_sort_key(key, verb)
             short_name_key = str(uuid.uuid4())
-            stmts_formatted.append((short_name, short_name_key, stmt_info_list))
-        metadata = {k.replace('_', ' ').title(): v
-                    for k, v in self.metadata.items()}
-        if self.db_rest_url and not self.db_rest_url.endswith('statements'):
-            db_rest_url = self.db_rest_url + '/statements'
-        else:
-            db_rest_url = '.'
-        self.model = template.render(stmt_data=stmts_formatted,
-                                     metadata=metadata, title=self.title,
-                                     db_rest_url=db_rest_url,
-                                     other_scripts=self.other_scripts,
-                                     ev_element=self.ev_element)
-        return self.model
+            yield short_name, short_name_key, stmt_info_list
 
     def append_warning(self, msg):
         """Append a warning message to the model to expose issues."""
@@ -163,17 +190,35 @@ class HtmlAssembler(object):
     def save_model(self, fname):
         """Save the assembled HTML into a file.
 
+        If the model hasn't been assembled yet, the HTML is rendered and
+        written to the file in chunks without being kept in memory as a
+        single string, in which case the model attribute remains None.
+
         Parameters
         ----------
         fname : str
             The path to the file to save the HTML into.
         """
         if self.model is None:
-            self.make_model()
+            self.stream_model(fname)
+            return
 
         with open(fname, 'wb') as fh:
             fh.write(self.model.encode('utf-8'))
 
+    def stream_model(self, fname):
+        """Render the HTML directly into a file in chunks.
+
+        Parameters
+        ----------
+        fname : str
+            The path to the file to save the HTML into.
+        """
+        stream = template.stream(**self._get_template_kwargs())
+        stream.enable_buffering()
+        with open(fname, 'wb') as fh:
+            stream.dump(fh, encoding='utf-8')
+
     @staticmethod
     def _format_evidence_text(stmt):
         """Returns evidence metadata with highlighted evidence text.
@@ -192,16 +237,18 @@ class HtmlAssembler(object):
             Evidence objects. The text entry of the dict includes
             `<span>` tags identifying the agents referenced by the Statement.
         """
-        def get_role(ag_ix):
-            if isinstance(stmt, Complex) or \
-               isinstance(stmt, SelfModification) or \
-               isinstance(stmt, ActiveForm) or isinstance(stmt, Conversion) or\
-               isinstance(stmt, Translocation):
-                return 'other'
-            else:
-                assert len(stmt.agent_list()) == 2, (len(stmt.agent_list()),
-                                                     type(stmt))
-                return 'subject' if ag_ix == 0 else 'object'
+        # The agents and their roles are the same for each Evidence so we
+        # get them and the corresponding tags only once
+        agents = stmt.agent_list()
+        role_is_other = isinstance(stmt, _other_role_types)
+        if role_is_other:
+            roles = ['other'] * len(agents)
+        else:
+            roles = ['subject'] + ['object'] * (len(agents) - 1)
+        # Get the tags with the correct badge
+        tag_starts = ['<span class="badge badge-%s">' % role
+                      for role in roles]
+        tag_close = '</span>'
 
         ev_list = []
         for ix, ev in enumerate(stmt.evidence):
@@ -218,7 +265,10 @@ class HtmlAssembler(object):
                 format_text = None
             else:
                 indices = []
-                for ix, ag in enumerate(stmt.agent_list()):
+                # Agents with the same text and tag would produce identical
+                # spans so we only find the spans once for each of these
+                tagged = set()
+                for ix, ag in enumerate(agents):
                     if ag is None:
                         continue
                     # If the statement has been preassembled, it will have
@@ -230,17 +280,21 @@ class HtmlAssembler(object):
                     # Otherwise we try to get the agent text from db_refs
                     except KeyError:
                         ag_text = ag.db_refs.get('TEXT')
-                    if ag_text is None:
+                    # Skip agents whose text doesn't appear in the evidence
+                    if ag_text is None or ag_text not in ev.text:
                         continue
-                    role = get_role(ix)
-                    # Get the tag with the correct badge
-                    tag_start = '<span class="badge badge-%s">' % role
-                    tag_close = '</span>'
+                    # Subject and object roles only make sense with
+                    # exactly two agents
+                    assert role_is_other or len(agents) == 2, \
+                        (len(agents), type(stmt))
+                    tag_start = tag_starts[ix]
+                    if (ag_text, tag_start) in tagged:
+                        continue
+                    tagged.add((ag_text, tag_start))
                     # Build up a set of indices
-                    indices += [(m.start(), m.start() + len(ag_text),
-                                 ag_text, tag_start, tag_close)
-                                 for m in re.finditer(re.escape(ag_text),
-                                                      ev.text)]
+                    indices += [(i, i + len(ag_text), ag_text,
+                                 tag_start, tag_close)
+                                for i in _find_all(ev.text, ag_text)]
                 format_text = tag_text(ev.text, indices)
 
             ev_list.append({'source_api': source_api,
@@ -252,17 +306,29 @@ class HtmlAssembler(object):
         return ev_list
 
     @staticmethod
-    def _format_stmt_text(stmt):
-        # Get the English assembled statement
-        ea = EnglishAssembler([stmt])
-        english = ea.make_model()
+    def _format_stmt_text(stmt, english=None, url_cache=None):
+        # Get the English assembled statement unless it is given
+        if english is None:
+            ea = EnglishAssembler([stmt])
+            english = ea.make_model()
         if not english:
             english = str(stmt)
         indices = []
         for ag in stmt.agent_list():
-            if ag is None or not ag.name:
+            # Skip agents whose name doesn't appear in the sentence
+            if ag is None or not ag.name or ag.name not in english:
                 continue
-            url = id_url(ag)
+            if url_cache is None:
+                url = id_url(ag)
+            else:
+                # The cache is keyed by the identity of the db_refs dict
+                # which is only valid while the given Statements are alive
+                db_refs_id = id(ag.db_refs)
+                if db_refs_id in url_cache:
+                    url = url_cache[db_refs_id]
+                else:
+                    url = id_url(ag)
+                    url_cache[db_refs_id] = url
             if url is None:
                 continue
             # Build up a set of indices
@@ -271,32 +337,61 @@ class HtmlAssembler(object):
             # FIXME: the EnglishAssembler capitalizes the first letter of
             # each sentence. In some cases this causes no match here
             # and not produce agent links.
-            indices += [(m.start(), m.start() + len(ag.name), ag.name,
-                         tag_start, tag_close)
-                         for m in re.finditer(re.escape(ag.name), english)]
+            indices += [(i, i + len(ag.name), ag.name, tag_start, tag_close)
+                        for i in _find_all(english, ag.name)]
         return tag_text(english, indices)
 
 
+@lru_cache(maxsize=256)
+def _format_metadata_key(key):
+    """Return a metadata key formatted for display, e.g. Evidence Totals."""
+    return key.replace('_', ' ').title()
+
+
+def _find_all(text, substring):
+    """Yield the start index of each non-overlapping occurrence of substring.
+
+    This is equivalent to iterating over re.finditer with the escaped
+    substring as the pattern but avoids the regular expression machinery
+    when matching a literal string.
+    """
+    if not substring:
+        return
+    start = text.find(substring)
+    while start != -1:
+        yield start
+        start = text.find(substring, start + len(substring))
+
+
+# The priority of name spaces used to link out to identifiers, lower values
+# having higher priority
+_id_url_priority = {db_name: ix for ix, db_name in
+                    enumerate(('HGNC', 'FPLX', 'UP', 'IP', 'PF', 'NXPFA',
+                               'MIRBASEM', 'MIRBASE',
+                               'MESH', 'GO',
+                               'HMDB', 'PUBCHEM', 'CHEBI',
+                               'NCIT',
+                               'UN', 'HUME', 'CWMS', 'SOFIA'))}
+
+
 def id_url(ag):
     # Return identifier URLs in a prioritized order
-    for db_name in ('HGNC', 'FPLX', 'UP', 'IP', 'PF', 'NXPFA',
-                    'MIRBASEM', 'MIRBASE',
-                    'MESH', 'GO',
-                    'HMDB', 'PUBCHEM', 'CHEBI',
-                    'NCIT',
-                    'UN', 'HUME', 'CWMS', 'SOFIA'):
-        if db_name in ag.db_refs:
-            # Handle a special case where a list of IDs is given
-            if isinstance(ag.db_refs[db_name], list):
-                db_id = ag.db_refs[db_name][0]
-                if db_name == 'CHEBI':
-                    if not db_id.startswith('CHEBI'):
-                        db_id = 'CHEBI:%s' % db_id
-                elif db_name in ('UN', 'HUME'):
-                    db_id = db_id[0]
-            else:
-                db_id = ag.db_refs[db_name]
-            return get_identifiers_url(db_name, db_id)
+    db_names = [db_name for db_name in ag.db_refs
+                if db_name in _id_url_priority]
+    if not db_names:
+        return None
+    db_name = min(db_names, key=_id_url_priority.get)
+    # Handle a special case where a list of IDs is given
+    if isinstance(ag.db_refs[db_name], list):
+        db_id = ag.db_refs[db_name][0]
+        if db_name == 'CHEBI':
+            if not db_id.startswith('CHEBI'):
+                db_id = 'CHEBI:%s' % db_id
+        elif db_name in ('UN', 'HUME'):
+            db_id = db_id[0]
+    else:
+        db_id = ag.db_refs[db_name]
+    return get_identifiers_url(db_name, db_id)
 
 
 def tag_text(text, tag_info_list):
@@ -319,39 +414,32 @@ def tag_text(text, tag_info_list):
         String where the specified substrings have been surrounded by the
         given start and close tags.
     """
-    # Check to tags for overlap and if there is any, return the subsumed
-    # range. Return None if no overlap.
-    def overlap(t1, t2):
-        if range(max(t1[0], t2[0]), min(t1[1]-1, t2[1]-1)+1):
-            if t1[1] - t1[0] >= t2[1] - t2[0]:
-                return t2
-            else:
-                return t1
+    # Sort the tags by their start position, then sweep through them once,
+    # keeping a tag only if it doesn't overlap with the last kept tag or is
+    # longer than it, in which case it replaces the last kept tag. Since the
+    # sort is stable, the first of overlapping tags of equal length is kept.
+    kept_tags = []
+    last_end = last_len = -1
+    for tag in sorted(tag_info_list, key=itemgetter(0)):
+        start, end = tag[0], tag[1]
+        if start < last_end:
+            if end - start <= last_len:
+                continue
+            kept_tags[-1] = tag
         else:
-            return None
-    # Remove subsumed tags
-    for t1, t2 in list(itertools.combinations(tag_info_list, 2)):
-        subsumed_tag = overlap(t1, t2)
-        if subsumed_tag is not None:
-            # Delete the subsumed tag from the list
-            try:
-                tag_ix = tag_info_list.index(subsumed_tag)
-                del tag_info_list[tag_ix]
-            # Ignore case where tag has already been deleted
-            except ValueError:
-                pass
-    # Sort the indices by their start position
-    tag_info_list.sort(key=lambda x: x[0])
+            kept_tags.append(tag)
+        last_end, last_len = end, end - start
+    tag_info_list = kept_tags
     # Now, add the marker text for each occurrence of the strings
-    format_text = ''
+    format_text_parts = []
     start_pos = 0
     for i, j, ag_text, tag_start, tag_close in tag_info_list:
         # Add the text before this agent, if any
-        format_text += text[start_pos:i]
+        format_text_parts.append(text[start_pos:i])
         # Add wrapper for this entity
-        format_text += tag_start + ag_text + tag_close
+        format_text_parts += [tag_start, ag_text, tag_close]
         # Now set the next start position
         start_pos = j
     # Add the last section of text
-    format_text += text[start_pos:]
-    return format_text
+    format_text_parts.append(text[start_pos:])
+    return ''.join(format_text_parts)
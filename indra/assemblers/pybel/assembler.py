@@ -3,7 +3,13 @@ from builtins import dict, str
 import uuid
 import logging
 import networkx as nx
-from copy import deepcopy, copy
+from copy import copy
+try:
+    from sys import intern
+except ImportError:
+    # Unicode strings can't be interned in Python 2
+    def intern(string):
+        return string
 import pybel
 import pybel.constants as pc
 from pybel.dsl import *
@@ -26,6 +32,40 @@ _indra_pybel_act_map = {
 
 _pybel_indra_act_map = {v: k for k, v in _indra_pybel_act_map.items()}
 
+# The URLs of the BEL namespaces used by the assembled PyBEL graphs
+_pybel_namespace_urls = {
+    'HGNC': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
+            'namespace/hgnc-human-genes/hgnc-human-genes-20170725.belns',
+    'UP': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
+          'namespace/swissprot/swissprot-20170725.belns',
+    'IP': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
+          'namespace/interpro/interpro-20170731.belns',
+    'FPLX': 'https://raw.githubusercontent.com/sorgerlab/famplex/'
+            '5f5b573fe26d7405dbccb711ae8e5697b6a3ec7e/export/famplex.belns',
+    #'PFAM':
+    #'NXPFA':
+    'CHEBI': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
+             'namespace/chebi-ids/chebi-ids-20170725.belns',
+    'GO': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
+          'namespace/go/go-20180109.belns',
+    'MESH': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
+            'namespace/mesh-processes/mesh-processes-20170725.belns'
+}
+
+# The relations linking a node to one of its variants or components
+_variant_relations = {pc.HAS_VARIANT, pc.HAS_COMPONENT}
+
+# The signs of the relations represented in signed graphs, 0 for positive and
+# 1 for negative
+_relation_signs = {rel: 0 for rel in pc.CAUSAL_INCREASE_RELATIONS}
+_relation_signs.update({rel: 0 for rel in _variant_relations})
+_relation_signs.update({rel: 1 for rel in pc.CAUSAL_DECREASE_RELATIONS})
+
+# The capitalized three-letter codes of amino acids used in PyBEL pmods,
+# interned like the PyBEL constants they are stored alongside
+_pybel_residues = {k: intern(v['short_name'].capitalize())
+                   for k, v in amino_acids.items()}
+
 
 class PybelAssembler(object):
     """Assembles a PyBEL graph from a set of INDRA Statements.
@@ -91,61 +131,75 @@ class PybelAssembler(object):
             copyright=copyright,
             disclaimer=disclaimer,
         )
-        ns_dict = {
-            'HGNC': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
-                    'namespace/hgnc-human-genes/hgnc-human-genes-20170725.belns',
-            'UP': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
-                  'namespace/swissprot/swissprot-20170725.belns',
-            'IP': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
-                  'namespace/interpro/interpro-20170731.belns',
-            'FPLX': 'https://raw.githubusercontent.com/sorgerlab/famplex/'
-                    '5f5b573fe26d7405dbccb711ae8e5697b6a3ec7e/export/famplex.belns',
-            #'PFAM':
-            #'NXPFA':
-            'CHEBI': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
-                     'namespace/chebi-ids/chebi-ids-20170725.belns',
-            'GO': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
-                  'namespace/go/go-20180109.belns',
-            'MESH': 'https://arty.scai.fraunhofer.de/artifactory/bel/'
-                    'namespace/mesh-processes/mesh-processes-20170725.belns'
-        }
-        self.model.namespace_url.update(ns_dict)
+        self.model.namespace_url.update(_pybel_namespace_urls)
         self.model.namespace_pattern['PUBCHEM'] = '\d+'
+        # The assembly methods for each Statement type are collected here as
+        # types are encountered
+        self._assemblers = {}
+        # PyBEL node data already built for agents, keyed by their grounding
+        # and variants, see _get_agent_node_key
+        self._agent_node_cache = {}
+        # The node data added to the model, keyed by their id
+        self._model_nodes = {}
 
     def add_statements(self, stmts_to_add):
         self.statements += stmts_to_add
 
     def make_model(self):
+        # Bind the lookup of assembly methods locally for the loop below
+        get_assembler = self._get_assembler
         for stmt in self.statements:
             # Skip statements with no subject
-            if stmt.agent_list()[0] is None and \
+            if _get_first_agent(stmt) is None and \
                     not isinstance(stmt, Conversion):
                 continue
             # Assemble statements
-            if isinstance(stmt, Modification):
-                self._assemble_modification(stmt)
-            elif isinstance(stmt, RegulateActivity):
-                self._assemble_regulate_activity(stmt)
-            elif isinstance(stmt, RegulateAmount):
-                self._assemble_regulate_amount(stmt)
-            elif isinstance(stmt, Gef):
-                self._assemble_gef(stmt)
-            elif isinstance(stmt, Gap):
-                self._assemble_gap(stmt)
-            elif isinstance(stmt, ActiveForm):
-                self._assemble_active_form(stmt)
-            elif isinstance(stmt, Complex):
-                self._assemble_complex(stmt)
-            elif isinstance(stmt, Conversion):
-                self._assemble_conversion(stmt)
-            elif isinstance(stmt, Autophosphorylation):
-                self._assemble_autophosphorylation(stmt)
-            elif isinstance(stmt, Transphosphorylation):
-                self._assemble_transphosphorylation(stmt)
-            else:
+            assembler, args = get_assembler(type(stmt))
+            if assembler is None:
                 logger.info('Unhandled statement: %s' % stmt)
+            else:
+                assembler(stmt, *args)
         return self.model
 
+    def _get_assembler(self, stmt_type):
+        """Return the method assembling Statements of the given type.
+
+        The method is found by checking the handled Statement types in order
+        the first time a given type is encountered, after which it is looked
+        up directly. It is returned along with the additional arguments it
+        takes for the type, such as whether the type is activating for polar
+        Statement types. None is returned as the method if the type is not
+        handled.
+        """
+        try:
+            return self._assemblers[stmt_type]
+        except KeyError:
+            pass
+        for handled_type, assembler, args in (
+                (AddModification, self._assemble_modification, (True,)),
+                (RemoveModification, self._assemble_modification, (False,)),
+                (Modification, self._assemble_modification, ()),
+                (Activation, self._assemble_regulate_activity, (True,)),
+                (Inhibition, self._assemble_regulate_activity, (False,)),
+                (RegulateActivity, self._assemble_regulate_activity, ()),
+                (IncreaseAmount, self._assemble_regulate_amount, (True,)),
+                (DecreaseAmount, self._assemble_regulate_amount, (False,)),
+                (RegulateAmount, self._assemble_regulate_amount, ()),
+                (Gef, self._assemble_gef, ()),
+                (Gap, self._assemble_gap, ()),
+                (ActiveForm, self._assemble_active_form, ()),
+                (Complex, self._assemble_complex, ()),
+                (Conversion, self._assemble_conversion, ()),
+                (Autophosphorylation, self._assemble_autophosphorylation, ()),
+                (Transphosphorylation, self._assemble_transphosphorylation,
+                 ())):
+            if issubclass(stmt_type, handled_type):
+                break
+        else:
+            assembler, args = None, ()
+        self._assemblers[stmt_type] = (assembler, args)
+        return assembler, args
+
     def to_database(self, manager=None):
         """Send the model to the PyBEL database
 
@@ -225,19 +279,12 @@ class PybelAssembler(object):
 
 
     def to_signed_graph(self, symmetric_variant_links=False):
-        edge_set = set()
-        for u, v, edge_data in self.model.edges(data=True):
-            rel = edge_data.get('relation')
-            if rel in pc.CAUSAL_INCREASE_RELATIONS:
-                edge_set.add((u, v, 0))
-            elif rel in (pc.HAS_VARIANT, pc.HAS_COMPONENT):
-                edge_set.add((u, v, 0))
-                if symmetric_variant_links:
-                    edge_set.add((v, u, 0))
-            elif rel in pc.CAUSAL_DECREASE_RELATIONS:
-                edge_set.add((u, v, 1))
-            else:
-                continue
+        relations = self.model.edges(data='relation')
+        edge_set = {(u, v, _relation_signs[rel]) for u, v, rel in relations
+                    if rel in _relation_signs}
+        if symmetric_variant_links:
+            edge_set.update((v, u, 0) for u, v, rel in relations
+                            if rel in _variant_relations)
         # Turn the tuples into dicts
         graph = nx.MultiDiGraph()
         graph.add_edges_from(
@@ -246,58 +293,81 @@ class PybelAssembler(object):
         )
         return graph
 
+    def _add_node(self, node_data):
+        """Add node data to the model unless it has already been added.
+
+        Node data built for agents are reused across Statements, so checking
+        their id here avoids hashing them again in the model for each edge.
+        """
+        node_id = id(node_data)
+        try:
+            return self._model_nodes[node_id]
+        except KeyError:
+            pass
+        # Keeping a reference to the node data also ensures that its id isn't
+        # reused by other objects
+        node = self.model.add_node_from_data(node_data)
+        self._model_nodes[node_id] = node
+        return node
+
     def _add_nodes_edges(self, subj_agent, obj_agent, relation, evidences):
         """Given subj/obj agents, relation, and evidence, add nodes/edges."""
-        subj_data, subj_edge = _get_agent_node(subj_agent)
-        obj_data, obj_edge = _get_agent_node(obj_agent)
+        subj_data, subj_edge = _get_agent_node(subj_agent,
+                                               self._agent_node_cache)
+        obj_data, obj_edge = _get_agent_node(obj_agent,
+                                             self._agent_node_cache)
         # If we failed to create nodes for subject or object, skip it
         if subj_data is None or obj_data is None:
             return
-        subj_node = self.model.add_node_from_data(subj_data)
-        obj_node = self.model.add_node_from_data(obj_data)
+        subj_node = self._add_node(subj_data)
+        obj_node = self._add_node(obj_data)
         edge_data_list = \
             _combine_edge_data(relation, subj_edge, obj_edge, evidences)
-        for edge_data in edge_data_list:
-            self.model.add_edge(subj_node, obj_node, **edge_data)
+        self.model.add_edges_from((subj_node, obj_node, edge_data)
+                                  for edge_data in edge_data_list)
 
-    def _assemble_regulate_activity(self, stmt):
+    def _assemble_regulate_activity(self, stmt, activates=None):
         """Example: p(HGNC:MAP2K1) => act(p(HGNC:MAPK1))"""
-        act_obj = deepcopy(stmt.obj)
-        act_obj.activity = stmt._get_activity_condition()
+        # Only the activity of the object is replaced so a plain shallow
+        # copy of it is enough here
+        act_obj = copy(stmt.obj)
         # We set is_active to True here since the polarity is encoded
         # in the edge (decreases/increases)
-        act_obj.activity.is_active = True
-        activates = isinstance(stmt, Activation)
+        act_obj.activity = ActivityCondition(stmt.obj_activity, True)
+        if activates is None:
+            activates = isinstance(stmt, Activation)
         relation = get_causal_edge(stmt, activates)
         self._add_nodes_edges(stmt.subj, act_obj, relation, stmt.evidence)
 
-    def _assemble_modification(self, stmt):
+    def _assemble_modification(self, stmt, activates=None):
         """Example: p(HGNC:MAP2K1) => p(HGNC:MAPK1, pmod(Ph, Thr, 185))"""
-        sub_agent = deepcopy(stmt.sub)
+        sub_agent = _copy_agent(stmt.sub)
         sub_agent.mods.append(stmt._get_mod_condition())
-        activates = isinstance(stmt, AddModification)
+        if activates is None:
+            activates = isinstance(stmt, AddModification)
         relation = get_causal_edge(stmt, activates)
         self._add_nodes_edges(stmt.enz, sub_agent, relation, stmt.evidence)
 
-    def _assemble_regulate_amount(self, stmt):
+    def _assemble_regulate_amount(self, stmt, activates=None):
         """Example: p(HGNC:ELK1) => p(HGNC:FOS)"""
-        activates = isinstance(stmt, IncreaseAmount)
+        if activates is None:
+            activates = isinstance(stmt, IncreaseAmount)
         relation = get_causal_edge(stmt, activates)
         self._add_nodes_edges(stmt.subj, stmt.obj, relation, stmt.evidence)
 
     def _assemble_gef(self, stmt):
         """Example: act(p(HGNC:SOS1), ma(gef)) => act(p(HGNC:KRAS), ma(gtp))"""
-        gef = deepcopy(stmt.gef)
+        gef = _copy_agent(stmt.gef)
         gef.activity = ActivityCondition('gef', True)
-        ras = deepcopy(stmt.ras)
+        ras = _copy_agent(stmt.ras)
         ras.activity = ActivityCondition('gtpbound', True)
         self._add_nodes_edges(gef, ras, pc.DIRECTLY_INCREASES, stmt.evidence)
 
     def _assemble_gap(self, stmt):
         """Example: act(p(HGNC:RASA1), ma(gap)) =| act(p(HGNC:KRAS), ma(gtp))"""
-        gap = deepcopy(stmt.gap)
+        gap = _copy_agent(stmt.gap)
         gap.activity = ActivityCondition('gap', True)
-        ras = deepcopy(stmt.ras)
+        ras = _copy_agent(stmt.ras)
         ras.activity = ActivityCondition('gtpbound', True)
         self._add_nodes_edges(gap, ras, pc.DIRECTLY_DECREASES, stmt.evidence)
 
@@ -311,7 +381,8 @@ class PybelAssembler(object):
 
     def _assemble_complex(self, stmt):
         """Example: complex(p(HGNC:MAPK14), p(HGNC:TAB1))"""
-        complex_data, _ = _get_complex_node(stmt.members)
+        complex_data, _ = _get_complex_node(stmt.members,
+                                            self._agent_node_cache)
         if complex_data is None:
             logger.info('skip adding complex with no members: %s', stmt.members)
             return
@@ -320,33 +391,30 @@ class PybelAssembler(object):
     def _assemble_conversion(self, stmt):
         """Example: p(HGNC:HK1) => rxn(reactants(a(CHEBI:"CHEBI:17634")),
                                        products(a(CHEBI:"CHEBI:4170")))"""
-        pybel_lists = ([], [])
-        for pybel_list, agent_list in \
-                            zip(pybel_lists, (stmt.obj_from, stmt.obj_to)):
-            for agent in agent_list:
-                node = _get_agent_grounding(agent)
-                # TODO check for missing grounding?
-                pybel_list.append(node)
+        # TODO check for missing grounding?
+        reactants = [_get_agent_grounding(agent) for agent in stmt.obj_from]
+        products = [_get_agent_grounding(agent) for agent in stmt.obj_to]
 
         rxn_node_data = reaction(
-            reactants=pybel_lists[0],
-            products=pybel_lists[1],
+            reactants=reactants,
+            products=products,
         )
         obj_node = self.model.add_node_from_data(rxn_node_data)
         obj_edge = None  # TODO: Any edge information possible here?
         # Add node for controller, if there is one
         if stmt.subj is not None:
-            subj_attr, subj_edge = _get_agent_node(stmt.subj)
-            subj_node = self.model.add_node_from_data(subj_attr)
+            subj_attr, subj_edge = _get_agent_node(stmt.subj,
+                                                   self._agent_node_cache)
+            subj_node = self._add_node(subj_attr)
             edge_data_list = _combine_edge_data(pc.DIRECTLY_INCREASES,
                                            subj_edge, obj_edge, stmt.evidence)
-            for edge_data in edge_data_list:
-                self.model.add_edge(subj_node, obj_node, **edge_data)
+            self.model.add_edges_from((subj_node, obj_node, edge_data)
+                                      for edge_data in edge_data_list)
 
     def _assemble_autophosphorylation(self, stmt):
         """Example: complex(p(HGNC:MAPK14), p(HGNC:TAB1)) =>
                                         p(HGNC:MAPK14, pmod(Ph, Tyr, 100))"""
-        sub_agent = deepcopy(stmt.enz)
+        sub_agent = _copy_agent(stmt.enz)
         mc = stmt._get_mod_condition()
         sub_agent.mods.append(mc)
         # FIXME Ignore any bound conditions on the substrate!!!
@@ -365,7 +433,7 @@ class PybelAssembler(object):
         assert len(stmt.enz.bound_conditions) == 1
         assert stmt.enz.bound_conditions[0].is_bound
         # Create a modified protein node for the bound target
-        sub_agent = deepcopy(stmt.enz.bound_conditions[0].agent)
+        sub_agent = _copy_agent(stmt.enz.bound_conditions[0].agent)
         sub_agent.mods.append(stmt._get_mod_condition())
         self._add_nodes_edges(stmt.enz, sub_agent, pc.DIRECTLY_INCREASES,
                               stmt.evidence)
@@ -378,6 +446,29 @@ class PybelAssembler(object):
         pass
 
 
+def _get_first_agent(stmt):
+    """Return the first agent of a Statement without building its agent list.
+    """
+    first = getattr(stmt, stmt._agent_order[0])
+    if isinstance(first, list):
+        return first[0] if first else None
+    return first
+
+
+def _copy_agent(agent):
+    """Return a shallow copy of an agent with its own condition lists.
+
+    The mods and bound_conditions lists of the copy can be changed and its
+    attributes reassigned without affecting the original agent, while the
+    rest of its content is shared with the original, which is much cheaper
+    than a deepcopy.
+    """
+    agent_copy = copy(agent)
+    agent_copy.mods = list(agent.mods)
+    agent_copy.bound_conditions = list(agent.bound_conditions)
+    return agent_copy
+
+
 def _combine_edge_data(relation, subj_edge, obj_edge, evidences):
     edge_data = {pc.RELATION: relation}
     if subj_edge:
@@ -386,37 +477,49 @@ def _combine_edge_data(relation, subj_edge, obj_edge, evidences):
         edge_data[pc.OBJECT] = obj_edge
     if not evidences:
         return [edge_data]
-    edge_data_list = []
-    for ev in evidences:
-        pybel_ev = _get_evidence(ev)
-        edge_data_one = copy(edge_data)
-        edge_data_one.update(pybel_ev)
-        edge_data_list.append(edge_data_one)
-    return edge_data_list
+    # Most Statements have a single Evidence in which case the base edge data
+    # doesn't need to be kept unchanged for other Evidences
+    if len(evidences) == 1:
+        edge_data.update(_get_evidence(evidences[0]))
+        return [edge_data]
+    return [dict(edge_data, **_get_evidence(ev)) for ev in evidences]
 
 
-def _get_agent_node(agent):
+def _get_agent_node(agent, node_cache=None):
     if not agent.bound_conditions:
-        return _get_agent_node_no_bcs(agent)
+        return _get_agent_node_no_bcs(agent, node_cache)
 
-    # "Flatten" the bound conditions for the agent at this level
-    agent_no_bc = deepcopy(agent)
-    agent_no_bc.bound_conditions = []
-    members = [agent_no_bc] + [
-        bc.agent
-        for bc in agent.bound_conditions
-        if bc.is_bound
-    ]
-    return _get_complex_node(members)
+    # "Flatten" the bound conditions for the agent at this level. The agent
+    # itself is represented without its bound conditions which are ignored by
+    # _get_agent_node_no_bcs so it doesn't need to be copied to remove them.
+    agent_data, _ = _get_agent_node_no_bcs(agent, node_cache)
+    members_list = [agent_data] if agent_data else []
+    members_list += _get_member_nodes((bc.agent
+                                       for bc in agent.bound_conditions
+                                       if bc.is_bound), node_cache)
+    return _make_complex_node(members_list)
 
 
-def _get_complex_node(members):
+def _get_complex_node(members, node_cache=None):
+    return _make_complex_node(_get_member_nodes(members, node_cache))
+
+
+def _get_member_nodes(members, node_cache=None):
+    """Return the node data of the given complex members that are grounded."""
     members_list = []
     for member in members:
-        member_data, member_edge = _get_agent_node(member)
+        # Only members with bound conditions need to be represented as
+        # nested complexes
+        if member.bound_conditions:
+            member_data, _ = _get_agent_node(member, node_cache)
+        else:
+            member_data, _ = _get_agent_node_no_bcs(member, node_cache)
         if member_data:
             members_list.append(member_data)
+    return members_list
+
 
+def _make_complex_node(members_list):
     if members_list:
         complex_node_data = complex_abundance(members=members_list)
         return complex_node_data, None
@@ -424,12 +527,53 @@ def _get_complex_node(members):
     return None, None
 
 
-def _get_agent_node_no_bcs(agent):
+def _get_agent_node_no_bcs(agent, node_cache=None):
     node_data = _get_agent_grounding(agent)
     if node_data is None:
         logger.warning('Agent %s has no grounding.', agent)
         return None, None
 
+    # The variants are built for each agent so that any problems with them
+    # are reported for each agent
+    variants = _get_agent_variants(agent)
+    if variants and not isinstance(node_data, CentralDogma):
+        logger.warning('Node should not have variants: %s, %s', node_data, variants)
+        variants = None
+
+    # If the node data was already built for an agent with the same
+    # grounding and variants, it is reused from the cache
+    if node_cache is None:
+        if variants:
+            node_data = node_data.with_variants(variants)
+    else:
+        key = _get_agent_node_key(node_data, agent)
+        try:
+            node_data = node_cache[key]
+        except KeyError:
+            if variants:
+                node_data = node_data.with_variants(variants)
+            node_cache[key] = node_data
+
+    if isinstance(node_data, (bioprocess, pathology)):
+        return node_data, None
+
+    # Also get edge data for the agent, which is built for each agent since
+    # edges are edited in place
+    edge_data = _get_agent_activity(agent)
+    return node_data, edge_data
+
+
+def _get_agent_node_key(node_data, agent):
+    """Return a hashable key of an agent's grounding and variants."""
+    mods = tuple((mod.mod_type, mod.residue, mod.position)
+                 for mod in agent.mods)
+    muts = tuple(mut.to_hgvs() for mut in agent.mutations)
+    return (node_data.function, node_data.namespace, node_data.name, mods,
+            muts)
+
+
+def _get_agent_variants(agent):
+    """Return the PyBEL variants of an agent's modifications and mutations."""
     variants = []
     for mod in agent.mods:
         pybel_mod = pmod_namespace.get(mod.mod_type)
@@ -439,8 +583,7 @@ def _get_agent_node_no_bcs(agent):
             continue
         var = pmod(namespace=pc.BEL_DEFAULT_NAMESPACE, name=pybel_mod)
         if mod.residue is not None:
-            res = amino_acids[mod.residue]['short_name'].capitalize()
-            var[pc.PMOD_CODE] = res
+            var[pc.PMOD_CODE] = _pybel_residues[mod.residue]
         if mod.position is not None:
             var[pc.PMOD_POSITION] = int(mod.position)
         variants.append(var)
@@ -448,76 +591,65 @@ def _get_agent_node_no_bcs(agent):
     for mut in agent.mutations:
         var = hgvs(mut.to_hgvs())
         variants.append(var)
-    
-    if variants and not isinstance(node_data, CentralDogma):
-        logger.warning('Node should not have variants: %s, %s', node_data, variants)
-    elif variants:
-        node_data = node_data.with_variants(variants)
-
-    if isinstance(node_data, (bioprocess, pathology)):
-        return node_data, None
-
-    # Also get edge data for the agent
-    edge_data = _get_agent_activity(agent)
-    return node_data, edge_data
+    return variants
 
 
 def _get_agent_grounding(agent):
     """Convert an agent to the corresponding PyBEL DSL object (to be filled with variants later)."""
-    def _get_id(_agent, key):
-        _id = _agent.db_refs.get(key)
-        if isinstance(_id, list):
-            _id = _id[0]
-        return _id
-
-    hgnc_id = _get_id(agent, 'HGNC')
-    if hgnc_id:
-        hgnc_name = hgnc_client.get_hgnc_name(hgnc_id)
-        if not hgnc_name:
-            logger.warning('Agent %s with HGNC ID %s has no HGNC name.',
-                           agent, hgnc_id)
-            return
-        return protein('HGNC', hgnc_name)
-
-    uniprot_id = _get_id(agent, 'UP')
-    if uniprot_id:
-        return protein('UP', uniprot_id)
-
-    fplx_id = _get_id(agent, 'FPLX')
-    if fplx_id:
-        return protein('FPLX', fplx_id)
-
-    pfam_id = _get_id(agent, 'PF')
-    if pfam_id:
-        return protein('PFAM', pfam_id)
+    db_refs = agent.db_refs
+    for db_ns, dsl, pybel_ns in _grounding_priority:
+        db_id = db_refs.get(db_ns)
+        if isinstance(db_id, list):
+            db_id = db_id[0]
+        if not db_id:
+            continue
+        if db_ns == 'HGNC':
+            hgnc_name = _get_hgnc_name(db_id)
+            if not hgnc_name:
+                logger.warning('Agent %s with HGNC ID %s has no HGNC name.',
+                               agent, db_id)
+                return
+            db_id = hgnc_name
+        elif db_ns == 'CHEBI' and db_id.startswith('CHEBI:'):
+            db_id = db_id[_chebi_prefix_len:]
+        return dsl(pybel_ns, db_id)
+    return
 
-    ip_id = _get_id(agent, 'IP')
-    if ip_id:
-        return protein('IP', ip_id)
 
-    fa_id = _get_id(agent, 'FA')
-    if fa_id:
-        return protein('NXPFA', fa_id)
+# The name spaces used to ground agents in order of priority, along with the
+# PyBEL DSL functions and name spaces the groundings are converted to
+_grounding_priority = (
+    ('HGNC', protein, 'HGNC'),
+    ('UP', protein, 'UP'),
+    ('FPLX', protein, 'FPLX'),
+    ('PF', protein, 'PFAM'),
+    ('IP', protein, 'IP'),
+    ('FA', protein, 'NXPFA'),
+    ('CHEBI', abundance, 'CHEBI'),
+    ('PUBCHEM', abundance, 'PUBCHEM'),
+    ('GO', bioprocess, 'GO'),
+    ('MESH', bioprocess, 'MESH'),
+)
 
-    chebi_id = _get_id(agent, 'CHEBI')
-    if chebi_id:
-        if chebi_id.startswith('CHEBI:'):
-            chebi_id = chebi_id[len('CHEBI:'):]
-        return abundance('CHEBI', chebi_id)
+_chebi_prefix_len = len('CHEBI:')
 
-    pubchem_id = _get_id(agent, 'PUBCHEM')
-    if pubchem_id:
-        return abundance('PUBCHEM', pubchem_id)
 
-    go_id = _get_id(agent, 'GO')
-    if go_id:
-        return bioprocess('GO', go_id)
+# HGNC names already looked up, keyed by HGNC ID
+_hgnc_names = {}
 
-    mesh_id = _get_id(agent, 'MESH')
-    if mesh_id:
-        return bioprocess('MESH', mesh_id)
 
-    return
+def _get_hgnc_name(hgnc_id):
+    # HGNC IDs missing from the local resource file are looked up on the
+    # web so caching the result avoids repeating requests for the same ID.
+    # Failed lookups are not cached since they can be due to web errors.
+    try:
+        return _hgnc_names[hgnc_id]
+    except KeyError:
+        pass
+    hgnc_name = hgnc_client.get_hgnc_name(hgnc_id)
+    if hgnc_name is not None:
+        _hgnc_names[hgnc_id] = hgnc_name
+    return hgnc_name
 
 
 def _get_agent_activity(agent):
@@ -556,10 +688,9 @@ def _get_evidence(evidence):
         annotations['source_api'] = evidence.source_api
     if evidence.source_id:
         annotations['source_id'] = evidence.source_id
-    for key, value in evidence.epistemics.items():
-        if key == 'direct':
-            continue
-        annotations[key] = value
+    annotations.update((key, value)
+                       for key, value in evidence.epistemics.items()
+                       if key != 'direct')
 
     if annotations:
         pybel_ev[pc.ANNOTATIONS] = annotations
@@ -567,13 +698,20 @@ def _get_evidence(evidence):
     return pybel_ev
 
 
+# Causal relations keyed by whether there is direct contact and whether the
+# subject activates the object
+_causal_edges = {
+    (True, True): pc.DIRECTLY_INCREASES,
+    (True, False): pc.DIRECTLY_DECREASES,
+    (False, True): pc.INCREASES,
+    (False, False): pc.DECREASES
+}
+
+
 def get_causal_edge(stmt, activates):
     """Returns the causal, polar edge with the correct "contact"."""
     any_contact = any(
         evidence.epistemics.get('direct', False)
         for evidence in stmt.evidence
     )
-    if any_contact:
-        return pc.DIRECTLY_INCREASES if activates else pc.DIRECTLY_DECREASES
-
-    return pc.INCREASES if activates else pc.DECREASES
+    return _causal_edges[(bool(any_contact), bool(activates))]
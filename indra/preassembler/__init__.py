@@ -894,12 +894,18 @@ def flatten_evidence(stmts, collect_from=None):
 
 
 def _flatten_evidence_for_stmt(stmt, collect_from):
-    supp_stmts = (stmt.supports if collect_from == 'supports'
-                                else stmt.supported_by)
-    total_evidence = set(stmt.evidence)
-    for supp_stmt in supp_stmts:
-        child_evidence = _flatten_evidence_for_stmt(supp_stmt, collect_from)
-        total_evidence = total_evidence.union(child_evidence)
+    # We walk the support graph iteratively, visiting each statement only
+    # once even if it can be reached along several paths
+    total_evidence = set()
+    seen = set()
+    stack = [stmt]
+    while stack:
+        st = stack.pop()
+        if id(st) in seen:
+            continue
+        seen.add(id(st))
+        total_evidence.update(st.evidence)
+        stack.extend(getattr(st, collect_from))
     return list(total_evidence)
 
 
@@ -358,10 +358,10 @@ class Statement(object):
         ag_list = []
         for ag_name in self._agent_order:
             ag_attr = getattr(self, ag_name)
-            if isinstance(ag_attr, Concept) or ag_attr is None:
+            if ag_attr is None or isinstance(ag_attr, Concept):
                 ag_list.append(ag_attr)
             elif isinstance(ag_attr, list):
-                if not all([isinstance(ag, Concept) for ag in ag_attr]):
+                if not all(isinstance(ag, Concept) for ag in ag_attr):
                     raise TypeError("Expected all elements of list to be Agent "
                                     "and/or Concept, but got: %s"
                                     % {type(ag) for ag in ag_attr})
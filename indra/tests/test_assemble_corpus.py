@@ -63,11 +63,69 @@ def test_load_stmts():
 
 def test_dump_stmts():
     ac.dump_statements([st1], '_test.pkl')
+    # Protocol 2 and above write their number after the PROTO opcode
+    with open('_test.pkl', 'rb') as fh:
+        header = fh.read(2)
+    assert header[:1] == b'\x80'
+    assert ord(header[1:]) == min(pickle.HIGHEST_PROTOCOL, 4)
     st_loaded = ac.load_statements('_test.pkl')
     assert len(st_loaded) == 1
     assert st_loaded[0].equals(st1)
 
 
+def test_dump_stmts_json():
+    st = deepcopy(st14)
+    ac.dump_statements([st, st.supports[0]], '_test.json')
+    st_loaded = ac.load_statements('_test.json')
+    assert len(st_loaded) == 2
+    assert st_loaded[0].equals(st)
+    assert st_loaded[0].supports[0] is st_loaded[1]
+
+
+def test_dump_stmts_jsonl():
+    st = deepcopy(st14)
+    ac.dump_statements([st, st.supports[0], st1], '_test.jsonl.gz')
+    st_loaded = ac.load_statements('_test.jsonl.gz')
+    assert len(st_loaded) == 3
+    assert st_loaded[0].supports[0] is st_loaded[1]
+    st_iter = list(ac.load_statements_iter('_test.jsonl.gz'))
+    assert len(st_iter) == 3
+    assert st_iter[2].equals(st1)
+    assert st_iter[2].evidence[0].text == 'a->b'
+
+
+def test_dump_stmts_async():
+    thread = ac.dump_statements_async([st1], '_test.pkl')
+    thread.join()
+    st_loaded = ac.load_statements('_test.pkl')
+    assert len(st_loaded) == 1
+    assert st_loaded[0].equals(st1)
+
+
+def test_dump_stmts_gzip():
+    ac.dump_statements([st1], '_test.pkl.gz')
+    with open('_test.pkl.gz', 'rb') as fh:
+        assert fh.read(2) == b'\x1f\x8b'
+    st_loaded = ac.load_statements('_test.pkl.gz')
+    assert len(st_loaded) == 1
+    assert st_loaded[0].equals(st1)
+
+
+def test_fast_clone():
+    st = ac._fast_clone(st14)
+    assert st is not st14
+    assert st.equals(st14)
+    assert st.supports[0] is st14.supports[0]
+    st = ac._fast_clone(st1)
+    assert st.evidence[0].text == st1.evidence[0].text
+    assert st.evidence[0] is not st1.evidence[0]
+    st_ha = HasActivity(a, 'kinase', True, evidence=[Evidence(text='a')])
+    st = ac._fast_clone(st_ha)
+    assert st is not st_ha
+    assert st.equals(st_ha)
+    assert st.evidence[0] is not st_ha.evidence[0]
+
+
 def test_filter_grounded_only():
     # st18 has and i, which has an ungrounded bound condition
     st_out = ac.filter_grounded_only([st1, st4])
@@ -97,6 +155,15 @@ def test_filter_grounded_only():
     assert len(st_out) == 1
 
 
+def test_filter_grounded_only_poolsize():
+    st_out = ac.filter_grounded_only([st1, st3, st4, st18, st19], poolsize=2)
+    assert len(st_out) == 3
+    # The original statement objects are returned
+    assert st_out[0] is st1
+    assert st_out[1] is st4
+    assert st_out[2] is st19
+
+
 def test_filter_grounded_only_score():
     c1 = Event(Concept('x', db_refs={'a': [('x', 0.5), ('y', 0.8)]}))
     c2 = Event(Concept('x', db_refs={'a': [('x', 0.7), ('y', 0.9)]}))
@@ -166,6 +233,15 @@ def test_filter_human_only():
     assert len(st_out[0].sub.bound_conditions) == 1
 
 
+def test_filter_empty_lists():
+    assert ac.filter_gene_list([st1, st2], [], 'one') == []
+    assert ac.filter_gene_list([st1, st2], [], 'one', invert=True) == \
+        [st1, st2]
+    assert ac.filter_by_db_refs([st1, st2], 'HGNC', [], 'one') == []
+    assert ac.filter_evidence_source([st1, st2], [], 'one') == []
+    assert ac.filter_evidence_source([st1, st2], [], 'none') == [st1, st2]
+
+
 def test_filter_gene_list_one():
     st_out = ac.filter_gene_list([st1, st2], ['a'], 'one')
     assert len(st_out) == 2
@@ -249,6 +325,8 @@ def test_strip_agent_context():
     assert not st_out[0].sub.bound_conditions
     assert not st_out[0].sub.activity
     assert not st_out[0].sub.location
+    assert st11.sub.mods
+    assert st11.sub.location == 'nucleus'
 
 
 def test_filter_direct():
@@ -267,6 +345,13 @@ def test_reduce_activities():
     st_out = ac.reduce_activities([st14, st15])
     assert st_out[0].obj_activity == 'kinase'
     assert st_out[1].obj_activity == 'kinase'
+    st_act = Activation(Agent('a', activity=ActivityCondition('activity',
+                                                              True)),
+                        Agent('b'))
+    st_kin = Activation(Agent('c'), Agent('a'), 'kinase')
+    st_out = ac.reduce_activities([st_act, st_kin])
+    assert st_out[0].subj.activity.activity_type == 'kinase'
+    assert st_act.subj.activity.activity_type == 'activity'
 
 
 def test_filter_source():
@@ -305,6 +390,8 @@ def test_map_grounding():
     assert st_out[0].subj.db_refs.get('FPLX')
     assert st_out[0].obj.db_refs.get('FPLX')
     assert st_out[0].obj.name == 'ERK'
+    assert ac._get_default_grounding_mapper(True) is \
+        ac._get_default_grounding_mapper(True)
 
 
 def test_map_grounding_user_map():
@@ -364,8 +451,9 @@ def test_filter_no_hypothesis():
     ev2 = Evidence(epistemics={'hypothesis': False})
     st1 = Phosphorylation(None, a, evidence=[ev1, ev2])
     st2 = Phosphorylation(None, a, evidence=[ev1, ev1])
-    st_out = ac.filter_no_hypothesis([st1, st2])
-    assert len(st_out) == 1
+    st3 = Phosphorylation(None, a)
+    st_out = ac.filter_no_hypothesis([st1, st2, st3])
+    assert st_out == [st1, st3]
 
 
 def test_filter_no_negated():
@@ -374,8 +462,9 @@ def test_filter_no_negated():
     ev2 = Evidence(epistemics={'negated': False})
     st1 = Phosphorylation(None, a, evidence=[ev1, ev2])
     st2 = Phosphorylation(None, a, evidence=[ev1, ev1])
-    st_out = ac.filter_no_negated([st1, st2])
-    assert len(st_out) == 1
+    st3 = Phosphorylation(None, a)
+    st_out = ac.filter_no_negated([st1, st2, st3])
+    assert st_out == [st1, st3]
 
 
 def test_belief_cut_plus_filter_top():
@@ -399,6 +488,7 @@ def test_filter_inconsequential_mods():
     whitelist = {'b': [('phosphorylation', None, None)]}
     st_out = ac.filter_inconsequential_mods([st1, st2], whitelist=whitelist)
     assert len(st_out) == 2
+    assert whitelist == {'b': [('phosphorylation', None, None)]}
 
 
 def test_filter_inconsequential_mods2():
@@ -460,6 +550,19 @@ def test_filter_mutation_status():
     assert len(st_out[0].enz.bound_conditions) == 0
 
 
+def test_filter_mutation_status_poolsize():
+    braf_mut = Agent('BRAF', mutations=MutCondition('600', 'V', 'E'))
+    braf_other_mut = Agent('BRAF', mutations=MutCondition('555', 'K', 'G'))
+    st1 = Phosphorylation(braf_mut, Agent('a'))
+    st2 = Phosphorylation(braf_other_mut, Agent('a'))
+    st3 = Phosphorylation(None, braf_mut)
+    mutations = {'BRAF': [('V', '600', 'E')]}
+    st_out = ac.filter_mutation_status([st1, st2, st3], mutations, [],
+                                       poolsize=2)
+    assert len(st_out) == 2
+    assert st_out[0] is st1 and st_out[1] is st3
+
+
 def test_get_unreachable_mods():
     st1 = Phosphorylation(Agent('X'), Agent('Y'), 'S', '222')
     mcs = [ModCondition('phosphorylation', 'S', '218', True),
@@ -479,6 +582,7 @@ def test_rename_db_ref():
     assert stmts[0].enz.db_refs.get('FPLX') == 'X'
     assert 'BE' not in stmts[0].enz.db_refs
     assert stmts[0].sub.db_refs.get('FPLX') == 'Y'
+    assert st1.enz.db_refs == {'BE': 'X'}
 
 
 def test_filter_concept_names():
@@ -626,3 +730,59 @@ def test_preassemble_flatten():
                                 flatten_evidence_collect_from='supports')
     assert len(st_out[0].evidence) == 1
     assert len(st_out[1].evidence) == 1
+
+
+def test_filter_enzyme_kinase():
+    st1 = Phosphorylation(Agent('MAPK1'), Agent('ELK1'))
+    st2 = Phosphorylation(Agent('TP53'), Agent('ELK1'))
+    st3 = Activation(Agent('TP53'), Agent('ELK1'))
+    st_out = ac.filter_enzyme_kinase([st1, st2, st3])
+    assert st_out == [st1, st3]
+    st6 = Ubiquitination(Agent('MAPK1'), Agent('ELK1'))
+    st7 = Ubiquitination(Agent('TP53'), Agent('ELK1'))
+    st_out = ac.filter_mod_nokinase([st1, st6, st7])
+    assert st_out == [st1, st7]
+    st4 = IncreaseAmount(Agent('RUNX1'), Agent('ELK1'))
+    st5 = IncreaseAmount(Agent('MAPK1'), Agent('ELK1'))
+    st_out = ac.filter_transcription_factor([st4, st5])
+    assert st_out == [st4]
+    # The table of transcription factors is only read once
+    assert ac._get_transcription_factor_names() is \
+        ac._get_transcription_factor_names()
+
+
+def test_align_statements():
+    st_a = Phosphorylation(Agent('a'), Agent('b'))
+    st_b = Activation(Agent('a'), Agent('b'))
+    st_c = Phosphorylation(Agent('c'), Agent('d'))
+    st_d = Phosphorylation(Agent('e'), Agent('f'))
+    matches = ac.align_statements([st_a, st_c], [st_b, st_d])
+    assert matches == [(st_a, st_b), (st_c, None), (None, st_d)]
+
+
+def test_rename_db_ref_influence():
+    ev = Evidence(text='x')
+    conc = Concept('x', db_refs={'UN': [('a/b', 1.0)]})
+    st = Influence(Event(conc), Event(Concept('y')), evidence=[ev])
+    st_out = ac.rename_db_ref([st], 'UN', 'WM')
+    assert st_out[0].subj.concept.db_refs == {'WM': [('a/b', 1.0)]}
+    assert st.subj.concept.db_refs == {'UN': [('a/b', 1.0)]}
+    assert st_out[0].evidence[0] is ev
+
+
+def test_standardize_names_groundings():
+    c1 = Concept('x', db_refs={'UN': [('UN/entities/food_security|x', 0.8)]})
+    c2 = Concept('y', db_refs={'CWMS': 'ONT::FOOD_SUPPLY'})
+    c3 = Concept('z', db_refs={'UN': [('UN/entities/rainfall', 0.8)]})
+    stmts = [Influence(Event(c1), Event(c2)), Influence(Event(c3), Event(c1))]
+    ac.standardize_names_groundings(stmts)
+    assert c1.name == 'Food security x'
+    assert c2.name == 'Food supply'
+    assert c3.name == 'Rainfall'
+
+
+def test_dump_stmt_strings():
+    ac.dump_stmt_strings([st1, st2], '_test.txt')
+    with open('_test.txt', 'rb') as fh:
+        lines = fh.read().decode('utf-8').splitlines()
+    assert lines == ['%s' % st1, '%s' % st2]
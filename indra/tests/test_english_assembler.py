@@ -440,6 +440,16 @@ def test_get_base_verb():
     assert ea.statement_base_verb('complex') == 'bind'
 
 
+def test_make_model_sentences():
+    st1 = Phosphorylation(Agent('MAP2K1'), Agent('MAPK1'))
+    st2 = Complex([Agent('BRAF'), Agent('RAF1')])
+    e = ea.EnglishAssembler([st1, st2])
+    sentences = e.make_model_sentences()
+    assert sentences == ['MAP2K1 phosphorylates MAPK1.',
+                         'BRAF binds RAF1.'], sentences
+    assert e.make_model() == ' '.join(sentences)
+
+
 def _stmt_to_text(st):
     e = ea.EnglishAssembler()
     e.add_statements([st])
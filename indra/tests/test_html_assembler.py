@@ -1,6 +1,8 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import dict, str
+import os
 import re
+import tempfile
 from indra.statements import *
 from indra.assemblers.html.assembler import HtmlAssembler, template_path, \
                                             tag_text
@@ -61,3 +63,42 @@ def test_tag_text():
     print(tagged_text)
     assert tagged_text == '<FooBarBaz>FooBarBaz</FooBarBaz> binds ' \
                           '<Foo>Foo</Foo>.'
+
+
+def test_tag_text_overlapping_spans():
+    """Of overlapping spans, only the longest is tagged."""
+    text = 'MEK ERK binds ERK.'
+    indices = [(0, 3, 'MEK', '<a>', '</a>'),
+               (0, 7, 'MEK ERK', '<b>', '</b>'),
+               (4, 7, 'ERK', '<c>', '</c>'),
+               (14, 17, 'ERK', '<c>', '</c>')]
+    tagged_text = tag_text(text, indices)
+    assert tagged_text == '<b>MEK ERK</b> binds <c>ERK</c>.', tagged_text
+
+
+def test_save_model():
+    stmt = make_stmt()
+    ha = HtmlAssembler([stmt])
+    fname = os.path.join(tempfile.mkdtemp(), 'test.html')
+    # Without a model, the HTML is streamed into the file
+    ha.save_model(fname)
+    assert ha.model is None
+    with open(fname, 'rb') as fh:
+        streamed = fh.read().decode('utf-8')
+    ha.make_model()
+    ha.save_model(fname)
+    with open(fname, 'rb') as fh:
+        saved = fh.read().decode('utf-8')
+    # The only difference is in the uuid keys assigned to statement rows
+    assert len(streamed) == len(saved)
+    assert streamed[:100] == saved[:100]
+
+
+def test_format_evidence_text_same_agent_text():
+    ev = Evidence(text='The kinase binds the kinase.', source_api='test',
+                  annotations={'agents': {'raw_text': ['kinase', 'kinase']}})
+    stmt = Complex([Agent('A'), Agent('B')], evidence=[ev])
+    ev_list = HtmlAssembler._format_evidence_text(stmt)
+    assert ev_list[0]['text'] == \
+        ('The <span class="badge badge-other">kinase</span> binds the '
+         '<span class="badge badge-other">kinase</span>.'), ev_list[0]['text']
@@ -566,6 +566,23 @@ def test_flatten_evidence_hierarchy_supports():
     assert set([e.text for e in supporting_stmt.evidence]) == {'foo', 'bar'}
 
 
+def test_flatten_evidence_diamond():
+    braf = Agent('BRAF')
+    mek = Agent('MAP2K1')
+    st1 = Phosphorylation(braf, mek, evidence=[Evidence(text='foo')])
+    st2 = Phosphorylation(braf, mek, 'S', evidence=[Evidence(text='bar')])
+    st3 = Phosphorylation(braf, mek, None, '218',
+                          evidence=[Evidence(text='baz')])
+    st4 = Phosphorylation(braf, mek, 'S', '218',
+                          evidence=[Evidence(text='bak')])
+    pa = Preassembler(hierarchies, stmts=[st1, st2, st3, st4])
+    pa.combine_related()
+    assert len(pa.related_stmts) == 1
+    flattened = flatten_evidence(pa.related_stmts)
+    texts = [ev.text for ev in flattened[0].evidence]
+    assert sorted(texts) == ['bak', 'bar', 'baz', 'foo'], texts
+
+
 def test_flatten_stmts():
     st1 = Phosphorylation(Agent('MAP3K5'), Agent('RAF1'), 'S', '338')
     st2 = Phosphorylation(None, Agent('RAF1'), 'S', '338')
@@ -441,6 +441,61 @@ def test_transphosphorylation():
     assert edge_data == {pc.RELATION: pc.DIRECTLY_INCREASES}
 
 
+def test_statements_not_modified():
+    braf = Agent('BRAF', db_refs={'HGNC': '1097', 'UP': 'P15056'})
+    mek = Agent('MAP2K1', db_refs={'HGNC': '6840', 'UP': 'Q02750'})
+    egfr = Agent('EGFR', db_refs={'HGNC': id('EGFR')})
+    egfr_dimer = Agent('EGFR', bound_conditions=[BoundCondition(egfr)],
+                       db_refs={'HGNC': id('EGFR')})
+    stmts = [Phosphorylation(braf, mek, 'S', '218'),
+             Activation(braf, mek),
+             Autophosphorylation(egfr_dimer, 'Y', '1173'),
+             Transphosphorylation(egfr_dimer, 'Y', '1173')]
+    pba = pa.PybelAssembler(stmts)
+    pba.make_model()
+    for agent in (braf, mek, egfr, egfr_dimer):
+        assert not agent.mods
+        assert agent.activity is None
+    assert len(egfr_dimer.bound_conditions) == 1
+
+
+def test_agent_node_cache():
+    braf = Agent('BRAF', db_refs={'HGNC': '1097'})
+    mek = Agent('MAP2K1', db_refs={'HGNC': '6840'})
+    mek_phos = Agent('MAP2K1', mods=[ModCondition('phosphorylation', 'S',
+                                                  '218')],
+                     db_refs={'HGNC': '6840'})
+    stmts = [Phosphorylation(braf, mek, 'S', '218'),
+             Phosphorylation(braf, mek, 'S', '218'),
+             IncreaseAmount(mek_phos, braf)]
+    pba = pa.PybelAssembler(stmts)
+    belgraph = pba.make_model()
+    # BRAF and phosphorylated MAP2K1 are each built once and then reused
+    assert len(pba._agent_node_cache) == 2
+    assert belgraph.number_of_nodes() == 3
+    assert belgraph.number_of_edges() == 4
+
+
+def test_to_signed_graph():
+    braf = Agent('BRAF', db_refs={'HGNC': '1097'})
+    mek = Agent('MAP2K1', db_refs={'HGNC': '6840'})
+    tp53 = Agent('TP53', db_refs={'HGNC': '11998'})
+    stmts = [Phosphorylation(braf, mek, 'S', '218'),
+             Inhibition(braf, tp53)]
+    pba = pa.PybelAssembler(stmts)
+    pba.make_model()
+    mek_phos_dsl = map2k1_dsl.with_variants(phos_dsl)
+    signed_graph = pba.to_signed_graph()
+    assert signed_graph.number_of_edges() == 3
+    assert get_edge_data(signed_graph, braf_dsl, mek_phos_dsl)['sign'] == 0
+    assert get_edge_data(signed_graph, map2k1_dsl, mek_phos_dsl)['sign'] == 0
+    assert get_edge_data(signed_graph, braf_dsl, tp53_dsl)['sign'] == 1
+    assert not signed_graph.has_edge(mek_phos_dsl, map2k1_dsl)
+    signed_graph = pba.to_signed_graph(symmetric_variant_links=True)
+    assert signed_graph.number_of_edges() == 4
+    assert get_edge_data(signed_graph, mek_phos_dsl, map2k1_dsl)['sign'] == 0
+
+
 """
 def test_translocation():
     foxo = Agent('FOXO1', db_refs={'HGNC': id('FOXO1')})
@@ -523,3 +578,81 @@ def test_no_activity_on_bioprocess():
 
     _, _, e = list(belgraph.edges(data=True))[0]
     assert pc.OBJECT not in e
+
+
+def test_citations_not_shared_between_models():
+    braf = Agent('BRAF', db_refs={'HGNC': '1097', 'UP': 'P15056'})
+    mek = Agent('MAP2K1', db_refs={'HGNC': '6840', 'UP': 'Q02750'})
+    stmts = [Phosphorylation(braf, mek, 'S', '218',
+                             evidence=[Evidence(source_api='test',
+                                                pmid='1234')])
+             for _ in range(2)]
+    graph1 = pa.PybelAssembler(stmts[:1]).make_model()
+    graph2 = pa.PybelAssembler(stmts[1:]).make_model()
+    # Citations are enriched in place, e.g., by PyBEL with PubMed data
+    get_first_edge_data(graph1)[pc.CITATION]['title'] = 'A title'
+    assert 'title' not in get_first_edge_data(graph2)[pc.CITATION]
+
+
+def test_evidence_data_not_shared_between_edges():
+    braf = Agent('BRAF', db_refs={'HGNC': '1097', 'UP': 'P15056'})
+    mek = Agent('MAP2K1', db_refs={'HGNC': '6840', 'UP': 'Q02750'})
+    tp53 = Agent('TP53', db_refs={'HGNC': '11998'})
+    ev = Evidence(source_api='test', pmid='1234')
+    stmts = [Activation(braf, mek, evidence=[ev]),
+             Activation(mek, tp53, evidence=[ev])]
+    belgraph = pa.PybelAssembler(stmts).make_model()
+    edge1 = get_edge_data(belgraph, braf_dsl, map2k1_dsl)
+    edge2 = get_edge_data(belgraph, map2k1_dsl, tp53_dsl)
+    edge1[pc.ANNOTATIONS]['curated'] = True
+    edge1[pc.CITATION]['title'] = 'A title'
+    assert 'curated' not in edge2[pc.ANNOTATIONS]
+    assert 'title' not in edge2[pc.CITATION]
+
+
+def test_evidence_of_new_statements():
+    braf = Agent('BRAF', db_refs={'HGNC': '1097', 'UP': 'P15056'})
+    mek = Agent('MAP2K1', db_refs={'HGNC': '6840', 'UP': 'Q02750'})
+    tp53 = Agent('TP53', db_refs={'HGNC': '11998'})
+    egfr = Agent('EGFR', db_refs={'HGNC': '3236'})
+    pba = pa.PybelAssembler([Activation(braf, mek, evidence=[
+        Evidence(source_api='test', text='old%d' % i, pmid=str(i))
+        for i in range(10)])])
+    pba.make_model()
+    # The Evidences of the earlier Statements are freed before new ones are
+    # made, which can then reuse their ids
+    pba.statements = []
+    pba.statements = [Activation(tp53, egfr, evidence=[
+        Evidence(source_api='test', text='new', pmid='1234')])]
+    belgraph = pba.make_model()
+    edge_data = get_edge_data(belgraph, tp53_dsl, egfr_dsl)
+    assert edge_data[pc.EVIDENCE] == 'new'
+    assert edge_data[pc.CITATION][pc.CITATION_REFERENCE] == '1234'
+
+
+def test_agent_edge_data_not_shared():
+    braf = Agent('BRAF', activity=ActivityCondition('kinase', True),
+                 db_refs={'HGNC': '1097', 'UP': 'P15056'})
+    mek = Agent('MAP2K1', db_refs={'HGNC': '6840', 'UP': 'Q02750'})
+    tp53 = Agent('TP53', db_refs={'HGNC': '11998'})
+    stmts = [IncreaseAmount(braf, mek), IncreaseAmount(braf, tp53)]
+    belgraph = pa.PybelAssembler(stmts).make_model()
+    edge1 = get_edge_data(belgraph, braf_dsl, map2k1_dsl)
+    edge2 = get_edge_data(belgraph, braf_dsl, tp53_dsl)
+    assert edge1[pc.SUBJECT] == edge2[pc.SUBJECT] == activity('kin')
+    edge1[pc.SUBJECT][pc.LOCATION] = {pc.NAMESPACE: 'GO', pc.NAME: 'nucleus'}
+    assert pc.LOCATION not in edge2[pc.SUBJECT]
+
+
+def test_hgnc_name_lookup_failure_not_cached():
+    names = iter([None, 'XYZ1'])
+    get_hgnc_name = pa.hgnc_client.get_hgnc_name
+    pa.hgnc_client.get_hgnc_name = lambda hgnc_id: next(names)
+    try:
+        # A failed lookup, e.g., due to a web error, is tried again later
+        assert pa._get_hgnc_name('_test_id') is None
+        assert pa._get_hgnc_name('_test_id') == 'XYZ1'
+        assert pa._get_hgnc_name('_test_id') == 'XYZ1'
+    finally:
+        pa.hgnc_client.get_hgnc_name = get_hgnc_name
+        pa._hgnc_names.pop('_test_id', None)
@@ -1,11 +1,14 @@
 from io import BytesIO
 import xml.etree.ElementTree as ET
 
-from indra.statements import Statement
+from indra.statements import Statement, Agent, Evidence, Complex, \
+    Phosphorylation
 
 from indra.util import unicode_strs
 from indra.util import UnicodeXMLTreeBuilder as UTB
-from indra.util.statement_presentation import _get_keyed_stmts
+from indra.util.statement_presentation import _get_keyed_stmts, \
+    group_and_sort_statements, make_string_from_sort_key, \
+    get_simplified_stmts, make_stmt_from_sort_key
 
 
 def test_unicode_tree_builder():
@@ -29,3 +32,80 @@ def test_conversion_keying():
     list(_get_keyed_stmts(stmt_list))
     return
 
+
+def test_group_and_sort_complex_pairs():
+    a, b, c = Agent('A'), Agent('B'), Agent('C')
+    ev = Evidence(source_api='test')
+    stmt_list = [Complex([a, b, c], evidence=[ev]),
+                 Phosphorylation(a, b, evidence=[ev, ev])]
+    groups = group_and_sort_statements(stmt_list)
+    # Only the pair of agents of the Complex which is also supported by
+    # another statement gets its own group
+    assert [tpl[0] for tpl in groups] == \
+        [(3, ('A', 'B'), 2, 'Phosphorylation'),
+         (3, ('A', 'B'), 1, 'Complex'),
+         (1, ('A', 'B', 'C'), 1, 'Complex')]
+
+
+def test_group_and_sort_ev_totals():
+    a, b = Agent('A'), Agent('B')
+    ev = Evidence(source_api='test')
+    st1 = Phosphorylation(a, b, evidence=[ev])
+    st2 = Phosphorylation(a, b, 'S', evidence=[ev, ev])
+    groups = group_and_sort_statements([st1, st2])
+    assert groups[0][2] == [st2, st1]
+    # The evidence totals take precedence over the evidences of statements
+    groups = group_and_sort_statements([st1, st2],
+                                       ev_totals={st1.get_hash(): 5})
+    assert groups[0][0] == (7, ('A', 'B'), 7, 'Phosphorylation')
+    assert groups[0][2] == [st1, st2]
+
+
+def test_keyed_stmts_no_pairwise_complex():
+    a, b, c = Agent('A'), Agent('B'), Agent('C')
+    stmt_list = [Complex([a, b, c]), Complex([a, b])]
+    keys = [key for key, _ in _get_keyed_stmts(stmt_list)]
+    assert len(keys) == 9
+    keys = [key for key, _ in _get_keyed_stmts(stmt_list,
+                                               pairwise_complex=False)]
+    assert keys == [('Complex', 'A', 'B', 'C'), ('Complex', 'A', 'B')]
+
+
+def test_make_string_from_sort_key():
+    key = (3, ('A', 'B'), 2, 'Phosphorylation')
+    assert make_string_from_sort_key(key, 'Phosphorylation') == \
+        'A phosphorylates B'
+    # Keys with the same arguments but other counts give the same string
+    key = (5, ('A', 'B'), 1, 'Phosphorylation')
+    assert make_string_from_sort_key(key, 'Phosphorylation') == \
+        'A phosphorylates B'
+    key = (5, ('A', 'B'), 1, 'Complex')
+    assert make_string_from_sort_key(key, 'Complex') == 'A binds B'
+    # The arguments can also be given as lists
+    key = ('Phosphorylation', ['A', 'B'])
+    assert make_string_from_sort_key(key, 'Phosphorylation') == \
+        'A phosphorylates B'
+    key = ('Conversion', ['A', ['B'], ['C']])
+    assert make_string_from_sort_key(key, 'Conversion') == \
+        'A catalyzes the conversion of B into C'
+
+
+def test_get_simplified_stmts():
+    a, b = Agent('A', db_refs={'HGNC': '1'}), Agent('B')
+    stmts = get_simplified_stmts([Phosphorylation(a, b, 'S', '10')])
+    assert len(stmts) == 1
+    assert isinstance(stmts[0], Phosphorylation)
+    assert stmts[0].enz.name == 'A'
+    assert not stmts[0].enz.db_refs
+    assert stmts[0].residue is None
+
+
+def test_make_stmt_from_sort_key():
+    key = (3, ('A', 'B'), 2, 'Phosphorylation')
+    st1 = make_stmt_from_sort_key(key, 'Phosphorylation')
+    st2 = make_stmt_from_sort_key(key, 'Phosphorylation')
+    assert isinstance(st1, Phosphorylation)
+    assert st1.equals(st2)
+    # Each call makes a new statement which can be changed independently
+    assert st1 is not st2
+    assert st1.enz is not st2.enz
@@ -2,6 +2,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 from builtins import dict, str
 import os
 import sys
+import gzip
+import json
 try:
     # Python 2
     import cPickle as pickle
@@ -9,7 +11,17 @@ except ImportError:
     # Python 3
     import pickle
 import logging
+import threading
+import multiprocessing as mp
 from copy import deepcopy, copy
+from functools import partial
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
+from itertools import chain
+from operator import itemgetter
+from collections import Counter, defaultdict
 from indra.statements import *
 from indra.belief import BeliefEngine
 from indra.util import read_unicode_csv
@@ -20,25 +32,207 @@ from indra.preassembler import Preassembler, flatten_evidence
 
 logger = logging.getLogger(__name__)
 
+# The first bytes of gzip files
+_gzip_magic = b'\x1f\x8b'
+
+# The separators of words in grounding IDs, mapped to spaces with translate
+_grounding_separators = {ord('|'): ' ', ord('_'): ' '}
+
+# The size of the buffers used to read and write pickle files, much larger
+# than the default to reduce the number of system calls on large files
+_pickle_buffer_size = 8 * 1024 * 1024
+
 
 def _filter(kwargs, arg_list):
     return dict(filter(lambda x: x[0] in arg_list, kwargs.items()))
 
 
-def dump_statements(stmts, fname, protocol=4):
+def _fast_clone(stmt):
+    """Return a copy of a Statement made by a round trip through JSON.
+
+    This is considerably faster than deepcopy for Statements with many
+    Evidences. The supports and supported_by lists of the copy refer to
+    the same Statements as the original's rather than to copies of them.
+    Statements of types which can't be loaded from JSON, such as
+    HasActivity, are copied with deepcopy instead.
+
+    Parameters
+    ----------
+    stmt : indra.statements.Statement
+        The Statement to copy.
+
+    Returns
+    -------
+    new_stmt : indra.statements.Statement
+        A copy of the Statement.
+    """
+    # Types without their own _from_json can't be loaded from JSON
+    if type(stmt)._from_json.__func__ is Statement._from_json.__func__:
+        return deepcopy(stmt)
+    new_stmt = Statement._from_json(stmt.to_json())
+    new_stmt.supports = stmt.supports[:]
+    new_stmt.supported_by = stmt.supported_by[:]
+    return new_stmt
+
+
+def _copy_agent(agent):
+    new_agent = copy(agent)
+    new_agent.db_refs = dict(agent.db_refs)
+    for attr in ('mods', 'mutations', 'bound_conditions'):
+        val = getattr(agent, attr, None)
+        if val is not None:
+            setattr(new_agent, attr, val[:])
+    # The activity type of the activity condition is changed in place when
+    # reducing activities
+    if getattr(agent, 'activity', None) is not None:
+        new_agent.activity = copy(agent.activity)
+    return new_agent
+
+
+def _copy_stmt_with_agents(stmt):
+    """Return a copy of a Statement with copies of its Agents.
+
+    Only the Statement, its Agents and the lists, db_refs and activity
+    conditions of the Agents are copied, so that these can be changed on the
+    copy without affecting the original. Evidences and supporting Statements
+    are shared with the original. The Events that are the arguments of
+    Influences and Associations are copied the same way.
+
+    Parameters
+    ----------
+    stmt : indra.statements.Statement
+        The Statement to copy.
+
+    Returns
+    -------
+    new_stmt : indra.statements.Statement
+        A copy of the Statement.
+    """
+    new_stmt = copy(stmt)
+    new_stmt.evidence = stmt.evidence[:]
+    new_stmt.supports = stmt.supports[:]
+    new_stmt.supported_by = stmt.supported_by[:]
+    for ag_name in stmt._agent_order:
+        ag_attr = getattr(stmt, ag_name)
+        if isinstance(ag_attr, list):
+            setattr(new_stmt, ag_name, [_copy_arg(ag) for ag in ag_attr])
+        else:
+            setattr(new_stmt, ag_name, _copy_arg(ag_attr))
+    return new_stmt
+
+
+def _copy_arg(arg):
+    if arg is None:
+        return None
+    elif isinstance(arg, Concept):
+        return _copy_agent(arg)
+    # Events are Statements themselves, with a Concept as their argument
+    elif isinstance(arg, Statement):
+        return _copy_stmt_with_agents(arg)
+    return deepcopy(arg)
+
+
+def _mode(values):
+    """Return the most common of the given values."""
+    return Counter(values).most_common(1)[0][0]
+
+
+def _get_file_format(fname):
+    """Return the format of a statement file based on its extension."""
+    if fname.endswith('.gz'):
+        fname = fname[:-len('.gz')]
+    if fname.endswith('.jsonl'):
+        return 'jsonl'
+    elif fname.endswith('.json'):
+        return 'json'
+    return 'pkl'
+
+
+def _dump_stmts_to_fh(stmts, fh, fname, protocol):
+    file_format = _get_file_format(fname)
+    # Statements are serialized as compact JSON into .json files
+    if file_format == 'json':
+        json_str = json.dumps(stmts_to_json(stmts), separators=(',', ':'))
+        fh.write(json_str.encode('utf-8'))
+    # and into .jsonl files with one statement per line
+    elif file_format == 'jsonl':
+        for stmt in stmts:
+            json_str = json.dumps(stmt.to_json(), separators=(',', ':'))
+            fh.write((json_str + '\n').encode('utf-8'))
+    else:
+        pickle.dump(stmts, fh, protocol=protocol)
+
+
+def _open_stmt_file(fname):
+    fh = open(fname, 'rb', buffering=_pickle_buffer_size)
+    # Gzipped files are recognized from their first bytes
+    is_gzipped = (fh.read(2) == _gzip_magic)
+    fh.seek(0)
+    if is_gzipped:
+        fh.close()
+        return gzip.open(fname, 'rb')
+    return fh
+
+
+def dump_statements(stmts, fname, protocol=None):
     """Dump a list of statements into a pickle file.
 
     Parameters
     ----------
     fname : str
-        The name of the pickle file to dump statements into.
+        The name of the pickle file to dump statements into. If the name
+        ends with .json (or .json.gz), the statements are serialized as
+        compact JSON instead, which doesn't depend on the Python version or
+        on INDRA's classes to be read. If the name ends with .jsonl, each
+        statement is serialized as JSON on a separate line, which allows
+        the file to be read one statement at a time with
+        load_statements_iter. If the name ends with .gz, the file is
+        compressed with gzip.
     protocol : Optional[int]
         The pickle protocol to use (use 2 for Python 2 compatibility).
-        Default: 4
+        Default: the highest protocol available, but at most 4 so that the
+        file can be loaded with any Python 3 version.
     """
+    if protocol is None:
+        protocol = min(pickle.HIGHEST_PROTOCOL, 4)
     logger.info('Dumping %d statements into %s...' % (len(stmts), fname))
-    with open(fname, 'wb') as fh:
-        pickle.dump(stmts, fh, protocol=protocol)
+    with open(fname, 'wb', buffering=_pickle_buffer_size) as fh:
+        if fname.endswith('.gz'):
+            with gzip.GzipFile(fileobj=fh, mode='wb') as gz_fh:
+                _dump_stmts_to_fh(stmts, gz_fh, fname, protocol)
+        else:
+            _dump_stmts_to_fh(stmts, fh, fname, protocol)
+
+
+def dump_statements_async(stmts, fname, protocol=None):
+    """Dump a list of statements into a pickle file in a background thread.
+
+    This allows further processing of the statements while they are being
+    written. The statements themselves must not be modified until the
+    returned thread has finished, otherwise the changes may or may not be
+    written to the file. The interpreter waits for the thread to finish
+    before exiting.
+
+    Parameters
+    ----------
+    stmts : list[indra.statements.Statement]
+        The statements to dump.
+    fname : str
+        The name of the file to dump statements into, see dump_statements.
+    protocol : Optional[int]
+        The pickle protocol to use, see dump_statements.
+
+    Returns
+    -------
+    thread : threading.Thread
+        The thread writing the file, which can be joined to wait for the
+        file to be written.
+    """
+    # The list is copied so that changes to it don't affect the dump
+    thread = threading.Thread(target=dump_statements,
+                              args=(list(stmts), fname, protocol))
+    thread.start()
+    return thread
 
 
 def load_statements(fname, as_dict=False):
@@ -47,7 +241,10 @@ def load_statements(fname, as_dict=False):
     Parameters
     ----------
     fname : str
-        The name of the pickle file to load statements from.
+        The name of the pickle file to load statements from. If the name
+        ends with .json or .jsonl (optionally followed by .gz), the
+        statements are loaded from JSON instead. The file can be compressed
+        with gzip.
     as_dict : Optional[bool]
         If True and the pickle file contains a dictionary of statements, it
         is returned as a dictionary. If False, the statements are always
@@ -59,9 +256,15 @@ def load_statements(fname, as_dict=False):
         A list or dict of statements that were loaded.
     """
     logger.info('Loading %s...' % fname)
-    with open(fname, 'rb') as fh:
+    file_format = _get_file_format(fname)
+    with _open_stmt_file(fname) as fh:
+        if file_format == 'json':
+            stmts = stmts_from_json(json.loads(fh.read().decode('utf-8')))
+        elif file_format == 'jsonl':
+            stmts = stmts_from_json(json.loads(line.decode('utf-8'))
+                                    for line in fh if line.strip())
         # Encoding argument not available in pickle for Python 2
-        if sys.version_info[0] < 3:
+        elif sys.version_info[0] < 3:
             stmts = pickle.load(fh)
         # Encoding argument specified here to enable compatibility with
         # pickle files created with Python 2
@@ -71,14 +274,52 @@ def load_statements(fname, as_dict=False):
     if isinstance(stmts, dict):
         if as_dict:
             return stmts
-        st = []
-        for pmid, st_list in stmts.items():
-            st += st_list
-        stmts = st
+        stmts = list(chain.from_iterable(stmts.values()))
     logger.info('Loaded %d statements' % len(stmts))
     return stmts
 
 
+def load_statements_iter(fname):
+    """Iterate over the statements in a file, one statement at a time.
+
+    Only .jsonl files (optionally gzipped) are read incrementally, so that
+    the whole file doesn't need to be held in memory. Other files are
+    loaded at once with load_statements before iterating over them.
+    References to supporting statements can not be resolved across lines
+    of a .jsonl file and are represented by Unresolved statements.
+
+    Parameters
+    ----------
+    fname : str
+        The name of the file to load statements from.
+
+    Returns
+    -------
+    stmts : generator[indra.statements.Statement]
+        A generator of the statements in the file.
+    """
+    if _get_file_format(fname) != 'jsonl':
+        for stmt in load_statements(fname):
+            yield stmt
+        return
+    logger.info('Loading %s one statement at a time...' % fname)
+    with _open_stmt_file(fname) as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            for stmt in stmts_from_json([json.loads(line.decode('utf-8'))]):
+                yield stmt
+
+
+@lru_cache(maxsize=None)
+def _get_default_grounding_mapper(use_adeft):
+    # Constructing a GroundingMapper checks every entry of the grounding
+    # map so the mapper for the default map is only built once per process
+    from indra.preassembler.grounding_mapper import GroundingMapper, gm, \
+        default_agent_map
+    return GroundingMapper(gm, default_agent_map, use_adeft=use_adeft)
+
+
 def map_grounding(stmts_in, **kwargs):
     """Map grounding using the GroundingMapper.
 
@@ -104,14 +345,16 @@ def map_grounding(stmts_in, **kwargs):
         A list of mapped statements.
     """
     from indra.preassembler.grounding_mapper import GroundingMapper
-    from indra.preassembler.grounding_mapper import gm as grounding_map
     from indra.preassembler.grounding_mapper import \
         default_agent_map as agent_map
     logger.info('Mapping grounding on %d statements...' % len(stmts_in))
     do_rename = kwargs.get('do_rename', True)
-    gm = kwargs.get('grounding_map', grounding_map)
-    gm = GroundingMapper(gm, agent_map,
-                         use_adeft=kwargs.get('use_adeft', True))
+    use_adeft = kwargs.get('use_adeft', True)
+    grounding_map = kwargs.get('grounding_map')
+    if grounding_map is None:
+        gm = _get_default_grounding_mapper(use_adeft)
+    else:
+        gm = GroundingMapper(grounding_map, agent_map, use_adeft=use_adeft)
     stmts_out = gm.map_agents(stmts_in, do_rename=do_rename)
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -146,20 +389,21 @@ def merge_groundings(stmts_in):
     def surface_grounding(stmt):
         # Find the "best" grounding for a given concept and its evidences
         # and surface that
+        # The raw groundings of each evidence are looked up once here rather
+        # than for each concept
+        raw_groundings = [ev.annotations['agents']['raw_grounding']
+                          for ev in stmt.evidence
+                          if 'agents' in ev.annotations]
         for idx, concept in enumerate(stmt.agent_list()):
             if concept is None:
                 continue
-            aggregate_groundings = {}
-            for ev in stmt.evidence:
-                if 'agents' in ev.annotations:
-                    groundings = ev.annotations['agents']['raw_grounding'][idx]
-                    for ns, value in groundings.items():
-                        if ns not in aggregate_groundings:
-                            aggregate_groundings[ns] = []
-                        if isinstance(value, list):
-                            aggregate_groundings[ns] += value
-                        else:
-                            aggregate_groundings[ns].append(value)
+            aggregate_groundings = defaultdict(list)
+            for ev_groundings in raw_groundings:
+                for ns, value in ev_groundings[idx].items():
+                    if isinstance(value, list):
+                        aggregate_groundings[ns] += value
+                    else:
+                        aggregate_groundings[ns].append(value)
             best_groundings = get_best_groundings(aggregate_groundings)
             concept.db_refs = best_groundings
 
@@ -170,18 +414,20 @@ def merge_groundings(stmts_in):
             # 1. All the entries in the list are scored in which case we
             # get unique entries and sort them by score
             if all([isinstance(v, (tuple, list)) for v in values]):
-                best_groundings[ns] = []
-                for unique_value in {v[0] for v in values}:
-                    scores = [v[1] for v in values if v[0] == unique_value]
-                    best_groundings[ns].append((unique_value, max(scores)))
-
+                # The highest score of each unique entry is found in a
+                # single pass over the entries
+                best_scores = {}
+                for v in values:
+                    best_score = best_scores.get(v[0])
+                    if best_score is None or v[1] > best_score:
+                        best_scores[v[0]] = v[1]
                 best_groundings[ns] = \
-                    sorted(best_groundings[ns], key=lambda x: x[1],
+                    sorted(best_scores.items(), key=itemgetter(1),
                            reverse=True)
             # 2. All the entries in the list are unscored in which case we
             # get the highest frequency entry
             elif all([not isinstance(v, (tuple, list)) for v in values]):
-                best_groundings[ns] = max(set(values), key=values.count)
+                best_groundings[ns] = _mode(values)
             # 3. There is a mixture, which can happen when some entries were
             # mapped with scores and others had no scores to begin with.
             # In this case, we again pick the highest frequency non-scored
@@ -189,8 +435,7 @@ def merge_groundings(stmts_in):
             else:
                 unscored_vals = [v for v in values
                                  if not isinstance(v, (tuple, list))]
-                best_groundings[ns] = max(set(unscored_vals),
-                                          key=unscored_vals.count)
+                best_groundings[ns] = _mode(unscored_vals)
         return best_groundings
 
     stmts_out = []
@@ -246,7 +491,7 @@ def merge_deltas(stmts_in):
         both_pols = [pair for pair in polarity_pairs if pair[0] is not None and
                      pair[1] is not None]
         if both_pols:
-            subj_pol, obj_pol = max(set(both_pols), key=both_pols.count)
+            subj_pol, obj_pol = _mode(both_pols)
             stmt.subj.delta.polarity = subj_pol
             stmt.obj.delta.polarity = obj_pol
         # Otherwise we prefer the case when at least one entry of the
@@ -255,7 +500,7 @@ def merge_deltas(stmts_in):
             one_pol = [pair for pair in polarity_pairs if pair[0] is not None or
                        pair[1] is not None]
             if one_pol:
-                subj_pol, obj_pol = max(set(one_pol), key=one_pol.count)
+                subj_pol, obj_pol = _mode(one_pol)
                 stmt.subj.delta.polarity = subj_pol
                 stmt.obj.delta.polarity = obj_pol
 
@@ -317,12 +562,8 @@ def map_sequence(stmts_in, **kwargs):
                     use_cache=kwargs.pop('use_cache', False),
                     **_filter(kwargs, kwarg_list))
     valid, mapped = sm.map_sites(stmts_in)
-    correctly_mapped_stmts = []
-    for ms in mapped:
-        correctly_mapped = all([mm.has_mapping() for mm in ms.mapped_mods])
-        if correctly_mapped:
-            correctly_mapped_stmts.append(ms.mapped_stmt)
-    stmts_out = valid + correctly_mapped_stmts
+    stmts_out = valid + [ms.mapped_stmt for ms in mapped
+                         if all(mm.has_mapping() for mm in ms.mapped_mods)]
     logger.info('%d statements with valid sites' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -532,10 +773,14 @@ def filter_by_type(stmts_in, stmt_type, **kwargs):
     logger.info('Filtering %d statements for type %s%s...' %
                 (len(stmts_in), 'not ' if invert else '',
                  stmt_type.__name__))
+    # The types occurring in the list are checked once each so that
+    # statements can then be filtered by looking up their type in a set
+    matching_types = {t for t in set(map(type, stmts_in))
+                      if issubclass(t, stmt_type)}
     if not invert:
-        stmts_out = [st for st in stmts_in if isinstance(st, stmt_type)]
+        stmts_out = [st for st in stmts_in if type(st) in matching_types]
     else:
-        stmts_out = [st for st in stmts_in if not isinstance(st, stmt_type)]
+        stmts_out = [st for st in stmts_in if type(st) not in matching_types]
 
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
@@ -544,31 +789,27 @@ def filter_by_type(stmts_in, stmt_type, **kwargs):
     return stmts_out
 
 
+def _agent_has_grounding(agent):
+    # False if there are no entries at all other than possibly TEXT, or if
+    # there are entries but they point to None / empty values
+    return any(val for db_name, val in agent.db_refs.items()
+               if db_name != 'TEXT')
+
+
 def _agent_is_grounded(agent, score_threshold):
-    grounded = True
-    db_names = list(set(agent.db_refs.keys()) - set(['TEXT']))
-    # If there are no entries at all other than possibly TEXT
-    if not db_names:
-        grounded = False
-    # If there are entries but they point to None / empty values
-    if not any([agent.db_refs[db_name] for db_name in db_names]):
-        grounded = False
+    if not _agent_has_grounding(agent):
+        return False
     # If we are looking for scored groundings with a threshold
     if score_threshold:
-        any_passing = False
-        for db_name in db_names:
-            val = agent.db_refs[db_name]
+        for db_name, val in agent.db_refs.items():
             # If it's a list with some values, find the
             # highest scoring match and compare to threshold
-            if isinstance(val, list) and val:
-                high_score = sorted(val, key=lambda x: x[1],
-                                    reverse=True)[0][1]
+            if db_name != 'TEXT' and isinstance(val, list) and val:
+                high_score = max(val, key=itemgetter(1))[1]
                 if high_score > score_threshold:
-                    any_passing = True
-                    break
-        if not any_passing:
-            grounded = False
-    return grounded
+                    return True
+        return False
+    return True
 
 
 def _remove_bound_conditions(agent, keep_criterion):
@@ -582,11 +823,8 @@ def _remove_bound_conditions(agent, keep_criterion):
         Evaluates removal_criterion(a) for each agent a in a bound condition
         and if it evaluates to False, removes a from agent's bound_conditions
     """
-    new_bc = []
-    for ind in range(len(agent.bound_conditions)):
-        if keep_criterion(agent.bound_conditions[ind].agent):
-            new_bc.append(agent.bound_conditions[ind])
-    agent.bound_conditions = new_bc
+    agent.bound_conditions = [bc for bc in agent.bound_conditions
+                              if keep_criterion(bc.agent)]
 
 
 def _any_bound_condition_fails_criterion(agent, criterion):
@@ -607,11 +845,56 @@ def _any_bound_condition_fails_criterion(agent, criterion):
         True if and only if any of the agents in a bound condition fail to match
         the specified criteria
     """
-    bc_agents = [bc.agent for bc in agent.bound_conditions]
-    for b in bc_agents:
-        if not criterion(b):
-            return True
-    return False
+    return any(not criterion(bc.agent) for bc in agent.bound_conditions)
+
+
+def _agents_meet_criterion(stmt, criterion, remove_bound=False):
+    """Return True if all agents of a statement meet the given criterion.
+
+    If remove_bound is True, the bound conditions of agents that fail to meet
+    the criterion are removed, otherwise they also have to meet it.
+    """
+    for agent in stmt.agent_list():
+        if agent is None:
+            continue
+        if not criterion(agent):
+            return False
+        if not isinstance(agent, Agent):
+            continue
+        if remove_bound:
+            _remove_bound_conditions(agent, criterion)
+        # Most agents have no bound conditions to check
+        elif agent.bound_conditions and \
+                _any_bound_condition_fails_criterion(agent, criterion):
+            return False
+    return True
+
+
+def _filter_agents_meet_criterion(stmts_in, criterion, remove_bound=False,
+                                  poolsize=None):
+    """Return the statements whose agents all meet the given criterion.
+
+    If a poolsize is given, the statements are checked in that many worker
+    processes, unless bound conditions are to be removed, since the agents
+    have to be changed in this process then.
+    """
+    stmt_criterion = partial(_agents_meet_criterion, criterion=criterion,
+                             remove_bound=remove_bound)
+    if remove_bound:
+        poolsize = None
+    if poolsize is None or sys.version_info < (3, 4):
+        return [st for st in stmts_in if stmt_criterion(st)]
+    # The workers only return whether each statement passes so that the
+    # original statement objects are kept in the output
+    logger.info('Checking statements with %d worker processes' % poolsize)
+    pool = mp.get_context('spawn').Pool(poolsize)
+    try:
+        chunksize = max(1, len(stmts_in) // (4 * poolsize))
+        passes = pool.map(stmt_criterion, stmts_in, chunksize=chunksize)
+    finally:
+        pool.close()
+        pool.join()
+    return [st for st, st_passes in zip(stmts_in, passes) if st_passes]
 
 
 def filter_grounded_only(stmts_in, **kwargs):
@@ -630,6 +913,11 @@ def filter_grounded_only(stmts_in, **kwargs):
         If true, removes ungrounded bound conditions from a statement.
         If false (default), filters out statements with ungrounded bound
         conditions.
+    poolsize : Optional[int]
+        The number of worker processes to use to check statements. If None
+        (default), or if remove_bound is True, no parallelization is
+        performed. NOTE: Parallelization is only available on Python 3.4 and
+        above.
 
     Returns
     -------
@@ -640,25 +928,16 @@ def filter_grounded_only(stmts_in, **kwargs):
 
     logger.info('Filtering %d statements for grounded agents...' % 
                 len(stmts_in))
-    stmts_out = []
     score_threshold = kwargs.get('score_threshold')
-    for st in stmts_in:
-        grounded = True
-        for agent in st.agent_list():
-            if agent is not None:
-                criterion = lambda x: _agent_is_grounded(x, score_threshold)
-                if not criterion(agent):
-                    grounded = False
-                    break
-                if not isinstance(agent, Agent):
-                    continue
-                if remove_bound:
-                    _remove_bound_conditions(agent, criterion)
-                elif _any_bound_condition_fails_criterion(agent, criterion):
-                    grounded = False
-                    break
-        if grounded:
-            stmts_out.append(st)
+    # Without a threshold, the simpler check is used directly as the criterion
+    if score_threshold:
+        criterion = partial(_agent_is_grounded,
+                            score_threshold=score_threshold)
+    else:
+        criterion = _agent_has_grounding
+    stmts_out = _filter_agents_meet_criterion(stmts_in, criterion,
+                                              remove_bound,
+                                              kwargs.get('poolsize'))
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -666,32 +945,30 @@ def filter_grounded_only(stmts_in, **kwargs):
     return stmts_out
 
 
-def _agent_is_gene(agent, specific_only):
+# The name spaces grounding agents to specific genes, and to genes in general
+# including families
+_specific_gene_ns = ('HGNC', 'UP')
+_gene_ns = ('HGNC', 'UP', 'FPLX')
+
+
+def _agent_is_gene(agent, gene_ns):
     """Returns whether an agent is for a gene.
 
     Parameters
     ----------
     agent: Agent
         The agent to evaluate
-    specific_only : Optional[bool]
-        If True, only elementary genes/proteins evaluate as genes and families
-        will be filtered out. If False, families are also included.
+    gene_ns : tuple[str]
+        The name spaces in which a grounding makes the agent a gene, either
+        _specific_gene_ns or _gene_ns.
 
     Returns
     -------
     is_gene: bool
         Whether the agent is a gene
     """
-    if not specific_only:
-        if not(agent.db_refs.get('HGNC') or \
-               agent.db_refs.get('UP') or \
-               agent.db_refs.get('FPLX')):
-            return False
-    else:
-        if not(agent.db_refs.get('HGNC') or \
-               agent.db_refs.get('UP')):
-            return False
-    return True
+    db_refs = agent.db_refs
+    return any(db_refs.get(ns) for ns in gene_ns)
 
 
 def filter_genes_only(stmts_in, **kwargs):
@@ -711,6 +988,11 @@ def filter_genes_only(stmts_in, **kwargs):
         If true, removes bound conditions that are not genes
         If false (default), filters out statements with non-gene bound
         conditions
+    poolsize : Optional[int]
+        The number of worker processes to use to check statements. If None
+        (default), or if remove_bound is True, no parallelization is
+        performed. NOTE: Parallelization is only available on Python 3.4 and
+        above.
 
     Returns
     -------
@@ -722,24 +1004,11 @@ def filter_genes_only(stmts_in, **kwargs):
     specific_only = kwargs.get('specific_only')
     logger.info('Filtering %d statements for ones containing genes only...' % 
                 len(stmts_in))
-    stmts_out = []
-    for st in stmts_in:
-        genes_only = True
-        for agent in st.agent_list():
-            if agent is not None:
-                criterion = lambda a: _agent_is_gene(a, specific_only)
-                if not criterion(agent):
-                    genes_only = False
-                    break
-                if remove_bound:
-                    _remove_bound_conditions(agent, criterion)
-                else:
-                    if _any_bound_condition_fails_criterion(agent, criterion):
-                        genes_only = False
-                        break
-
-        if genes_only:
-            stmts_out.append(st)
+    gene_ns = _specific_gene_ns if specific_only else _gene_ns
+    criterion = partial(_agent_is_gene, gene_ns=gene_ns)
+    stmts_out = _filter_agents_meet_criterion(stmts_in, criterion,
+                                              remove_bound,
+                                              kwargs.get('poolsize'))
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -769,28 +1038,42 @@ def filter_belief(stmts_in, belief_cutoff, **kwargs):
     logger.info('Filtering %d statements to above %f belief' %
                 (len(stmts_in), belief_cutoff))
     # The first round of filtering is in the top-level list
-    stmts_out = []
-    # Now we eliminate supports/supported-by
-    for stmt in stmts_in:
-        if stmt.belief < belief_cutoff:
-            continue
-        stmts_out.append(stmt)
-        supp_by = []
-        supp = []
-        for st in stmt.supports:
-            if st.belief >= belief_cutoff:
-                supp.append(st)
-        for st in stmt.supported_by:
-            if st.belief >= belief_cutoff:
-                supp_by.append(st)
-        stmt.supports = supp
-        stmt.supported_by = supp_by
+    stmts_out = [stmt for stmt in stmts_in if stmt.belief >= belief_cutoff]
+    # Now we eliminate supports/supported-by, skipping the lists that are
+    # empty as is the case for most statements
+    for stmt in stmts_out:
+        if stmt.supports:
+            stmt.supports = [st for st in stmt.supports
+                             if st.belief >= belief_cutoff]
+        if stmt.supported_by:
+            stmt.supported_by = [st for st in stmt.supported_by
+                                 if st.belief >= belief_cutoff]
     logger.info('%d statements after filter...' % len(stmts_out))
     if dump_pkl:
         dump_statements(stmts_out, dump_pkl)
     return stmts_out
 
 
+@lru_cache(maxsize=None)
+def _get_famplex_parent_ids(hgnc_name):
+    # Finding the parents of a gene scans the whole entity hierarchy, so the
+    # result is cached for each gene name
+    hgnc_id = hgnc_client.get_hgnc_id(hgnc_name)
+    if not hgnc_id:
+        logger.warning('Could not get HGNC ID for %s.' % hgnc_name)
+        return ()
+    gene_uri = hierarchies['entity'].get_uri('HGNC', hgnc_id)
+    parents = hierarchies['entity'].get_parents(gene_uri)
+    return tuple(hierarchies['entity'].ns_id_from_uri(par_uri)[1]
+                 for par_uri in parents)
+
+
+def _agent_names(agents):
+    # The names of the agents are compared to sets of names in bulk with
+    # isdisjoint/issuperset rather than one at a time
+    return (agent.name for agent in agents if agent is not None)
+
+
 def filter_gene_list(stmts_in, gene_list, policy, allow_families=False,
                      **kwargs):
     """Return statements that contain genes given in a list.
@@ -836,63 +1119,53 @@ def filter_gene_list(stmts_in, gene_list, policy, allow_families=False,
         logger.info(('Filtering %d statements for ones %scontaining "%s" of: '
                      '%s...') % (len(stmts_in), inv_str, policy, genes_str))
 
-    # If we're allowing families, make a list of all FamPlex IDs that
-    # contain members of the gene list, and add them to the filter list
-    filter_list = copy(gene_list)
+    # If we're allowing families, make a set of all FamPlex IDs that
+    # contain members of the gene list, and add them to the filter set.
+    # Names are looked up for every agent so they are kept in a set.
+    filter_set = frozenset(gene_list)
     if allow_families:
+        families = set()
         for hgnc_name in gene_list:
-            hgnc_id = hgnc_client.get_hgnc_id(hgnc_name)
-            if not hgnc_id:
-                logger.warning('Could not get HGNC ID for %s.' % hgnc_name)
-            gene_uri = hierarchies['entity'].get_uri('HGNC', hgnc_id)
-            parents = hierarchies['entity'].get_parents(gene_uri)
-            for par_uri in parents:
-                ns, id = hierarchies['entity'].ns_id_from_uri(par_uri)
-                filter_list.append(id)
-    stmts_out = []
+            families.update(_get_famplex_parent_ids(hgnc_name))
+        filter_set |= families
 
-    if remove_bound:
-        # If requested, remove agents whose names are not in the list from
-        # all bound conditions
-        if not invert:
-            keep_criterion = lambda a: a.name in filter_list
-        else:
-            keep_criterion = lambda a: a.name not in filter_list
-
-        for st in stmts_in:
-            for agent in st.agent_list():
-                _remove_bound_conditions(agent, keep_criterion)
+    # If requested, remove agents whose names are not in the list from
+    # all bound conditions
+    if not invert:
+        keep_criterion = lambda a: a.name in filter_set
+    else:
+        keep_criterion = lambda a: a.name not in filter_set
 
     if policy == 'one':
-        for st in stmts_in:
-            found_gene = False
-            if not remove_bound:
-                agent_list = st.agent_list_with_bound_condition_agents()
-            else:
-                agent_list = st.agent_list()
-            for agent in agent_list:
-                if agent is not None:
-                    if agent.name in filter_list:
-                        found_gene = True
-                        break
-            if (found_gene and not invert) or (not found_gene and invert):
-                stmts_out.append(st)
+        found_genes = lambda agents: \
+            not filter_set.isdisjoint(_agent_names(agents))
     elif policy == 'all':
+        found_genes = lambda agents: \
+            filter_set.issuperset(_agent_names(agents))
+    else:
+        found_genes = None
+    # The result of the check is flipped by comparing it to invert
+    invert = bool(invert)
+
+    # With no genes to look for, no statement can contain one of them, so
+    # the statements don't need to be looked at unless bound conditions are
+    # to be removed
+    if not filter_set and policy == 'one' and not remove_bound:
+        stmts_out = list(stmts_in) if invert else []
+    else:
+        # The agents of each statement are listed once and used both to
+        # remove bound conditions and to apply the policy
+        stmts_out = []
         for st in stmts_in:
-            found_genes = True
-            if not remove_bound:
-                agent_list = st.agent_list_with_bound_condition_agents()
-            else:
+            if remove_bound:
                 agent_list = st.agent_list()
-            for agent in agent_list:
-                if agent is not None:
-                    if agent.name not in filter_list:
-                        found_genes = False
-                        break
-            if (found_genes and not invert) or (not found_genes and invert):
+                for agent in agent_list:
+                    if agent is not None:
+                        _remove_bound_conditions(agent, keep_criterion)
+            else:
+                agent_list = st.agent_list_with_bound_condition_agents()
+            if found_genes is None or found_genes(agent_list) != invert:
                 stmts_out.append(st)
-    else:
-        stmts_out = stmts_in
 
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
@@ -936,30 +1209,19 @@ def filter_concept_names(stmts_in, name_list, policy, **kwargs):
         logger.info(('Filtering %d statements for ones %scontaining "%s" of: '
                      '%s...') % (len(stmts_in), inv_str, policy, name_str))
 
-    stmts_out = []
+    name_set = frozenset(name_list)
 
-    if policy == 'one':
-        for st in stmts_in:
-            found = False
-            agent_list = st.agent_list()
-            for agent in agent_list:
-                if agent is not None:
-                    if agent.name in name_list:
-                        found = True
-                        break
-            if (found and not invert) or (not found and invert):
-                stmts_out.append(st)
-    elif policy == 'all':
-        for st in stmts_in:
-            found = True
-            agent_list = st.agent_list()
-            for agent in agent_list:
-                if agent is not None:
-                    if agent.name not in name_list:
-                        found = False
-                        break
-            if (found and not invert) or (not found and invert):
-                stmts_out.append(st)
+    def has_one(st):
+        return not name_set.isdisjoint(_agent_names(st.agent_list()))
+
+    def has_all(st):
+        return name_set.issuperset(_agent_names(st.agent_list()))
+
+    if policy in ('one', 'all'):
+        found = has_one if policy == 'one' else has_all
+        # The result of the check is flipped by comparing it to invert
+        invert = bool(invert)
+        stmts_out = [st for st in stmts_in if found(st) != invert]
     else:
         stmts_out = stmts_in
 
@@ -1017,31 +1279,36 @@ def filter_by_db_refs(stmts_in, namespace, values, policy, **kwargs):
                      'grounded to: %s in the %s namespace...') %
                         (len(stmts_in), policy, rev_mod, name_str, namespace))
 
+    # The way entries are matched is decided once here: suffixes are matched
+    # with a single call to endswith on a tuple, and entire entries are
+    # looked up in a set
+    if match_suffix:
+        values_tuple = tuple(values)
+
+        def matches(entry):
+            return entry.endswith(values_tuple)
+    else:
+        matches = frozenset(values).__contains__
+    # The result of the match is flipped by comparing it to invert
+    invert = bool(invert)
+
     def meets_criterion(agent):
         if namespace not in agent.db_refs:
             return False
         entry = agent.db_refs[namespace]
         if isinstance(entry, list):
             entry = entry[0][0]
-        ret = False
-        # Match suffix or entire entry
-        if match_suffix:
-            if any([entry.endswith(e) for e in values]):
-                ret = True
-        else:
-            if entry in values:
-                ret = True
-        # Invert if needed
-        if invert:
-            return not ret
-        else:
-            return ret
+        return matches(entry) != invert
 
     enough = all if policy == 'all' else any
 
-    stmts_out = [s for s in stmts_in
-                 if enough([meets_criterion(ag) for ag in s.agent_list()
-                            if ag is not None])]
+    # No agent can match an empty list of values
+    if not values and policy == 'one' and not invert:
+        stmts_out = []
+    else:
+        stmts_out = [s for s in stmts_in
+                     if enough(meets_criterion(ag) for ag in s.agent_list()
+                               if ag is not None)]
 
     logger.info('%d Statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
@@ -1050,6 +1317,12 @@ def filter_by_db_refs(stmts_in, namespace, values, policy, **kwargs):
     return stmts_out
 
 
+def _agent_is_human(agent):
+    from indra.databases import uniprot_client
+    upid = agent.db_refs.get('UP')
+    return not upid or uniprot_client.is_human(upid)
+
+
 def filter_human_only(stmts_in, **kwargs):
     """Filter out statements that are grounded, but not to a human gene.
 
@@ -1063,45 +1336,24 @@ def filter_human_only(stmts_in, **kwargs):
         If true, removes all bound conditions that are grounded but not to human
         genes. If false (default), filters out statements with boundary
         conditions that are grounded to non-human genes.
+    poolsize : Optional[int]
+        The number of worker processes to use to check statements. If None
+        (default), or if remove_bound is True, no parallelization is
+        performed. NOTE: Parallelization is only available on Python 3.4 and
+        above.
 
     Returns
     -------
     stmts_out : list[indra.statements.Statement]
         A list of filtered statements.
     """
-    from indra.databases import uniprot_client
-    if 'remove_bound' in kwargs and kwargs['remove_bound']:
-        remove_bound = True
-    else:
-        remove_bound = False
-
+    remove_bound = kwargs.get('remove_bound', False)
     dump_pkl = kwargs.get('save')
     logger.info('Filtering %d statements for human genes only...' %
                 len(stmts_in))
-    stmts_out = []
-
-    def criterion(agent):
-        upid = agent.db_refs.get('UP')
-        if upid and not uniprot_client.is_human(upid):
-            return False
-        else:
-            return True
-
-
-    for st in stmts_in:
-        human_genes = True
-        for agent in st.agent_list():
-            if agent is not None:
-                if not criterion(agent):
-                    human_genes = False
-                    break
-                if remove_bound:
-                    _remove_bound_conditions(agent, criterion)
-                elif _any_bound_condition_fails_criterion(agent, criterion):
-                    human_genes = False
-                    break
-        if human_genes:
-            stmts_out.append(st)
+    stmts_out = _filter_agents_meet_criterion(stmts_in, _agent_is_human,
+                                              remove_bound,
+                                              kwargs.get('poolsize'))
     logger.info('%d statements after filter...' % len(stmts_out))
     if dump_pkl:
         dump_statements(stmts_out, dump_pkl)
@@ -1134,20 +1386,16 @@ def filter_direct(stmts_in, **kwargs):
         """
         any_indirect = False
         for ev in stmt.evidence:
-            if ev.epistemics.get('direct') is True:
+            direct = ev.epistemics.get('direct')
+            if direct is True:
                 return True
-            elif ev.epistemics.get('direct') is False:
+            elif direct is False:
                 # This guarantees that we have seen at least
                 # some evidence that the statement is indirect
                 any_indirect = True
-        if any_indirect:
-            return False
-        return True
+        return not any_indirect
     logger.info('Filtering %d statements to direct ones...' % len(stmts_in))
-    stmts_out = []
-    for st in stmts_in:
-        if get_is_direct(st):
-            stmts_out.append(st)
+    stmts_out = [st for st in stmts_in if get_is_direct(st)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1171,18 +1419,11 @@ def filter_no_hypothesis(stmts_in, **kwargs):
         A list of filtered statements.
     """
     logger.info('Filtering %d statements to no hypothesis...' % len(stmts_in))
-    stmts_out = []
-    for st in stmts_in:
-        all_hypotheses = True
-        ev = None
-        for ev in st.evidence:
-            if not ev.epistemics.get('hypothesis', False):
-                all_hypotheses = False
-                break
-        if ev is None:
-            all_hypotheses = False
-        if not all_hypotheses:
-            stmts_out.append(st)
+    # Statements without evidence are kept
+    stmts_out = [st for st in stmts_in
+                 if not st.evidence or
+                 any(not ev.epistemics.get('hypothesis', False)
+                     for ev in st.evidence)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1206,18 +1447,11 @@ def filter_no_negated(stmts_in, **kwargs):
         A list of filtered statements.
     """
     logger.info('Filtering %d statements to not negated...' % len(stmts_in))
-    stmts_out = []
-    for st in stmts_in:
-        all_negated = True
-        ev = None
-        for ev in st.evidence:
-            if not ev.epistemics.get('negated', False):
-                all_negated = False
-                break
-        if ev is None:
-            all_negated = False
-        if not all_negated:
-            stmts_out.append(st)
+    # Statements without evidence are kept
+    stmts_out = [st for st in stmts_in
+                 if not st.evidence or
+                 any(not ev.epistemics.get('negated', False)
+                     for ev in st.evidence)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1250,18 +1484,29 @@ def filter_evidence_source(stmts_in, source_apis, policy='one', **kwargs):
     """
     logger.info('Filtering %d statements to evidence source "%s" of: %s...' %
                 (len(stmts_in), policy, ', '.join(source_apis)))
-    stmts_out = []
-    for st in stmts_in:
-        sources = set([ev.source_api for ev in st.evidence])
-        if policy == 'one':
-            if sources.intersection(source_apis):
-                stmts_out.append(st)
-        if policy == 'all':
-            if sources.intersection(source_apis) == set(source_apis):
-                stmts_out.append(st)
-        if policy == 'none':
-            if not sources.intersection(source_apis):
-                stmts_out.append(st)
+    source_set = frozenset(source_apis)
+
+    # isdisjoint stops at the first source in the set, while issubset needs
+    # the set of all the sources of the statement
+    def has_any_source(st):
+        return not source_set.isdisjoint(ev.source_api for ev in st.evidence)
+
+    def has_all_sources(st):
+        return source_set.issubset({ev.source_api for ev in st.evidence})
+
+    # The check is chosen once based on the policy. Without any sources,
+    # no statement has evidence from one of them, and all statements have
+    # evidence from all (none) of them
+    if not source_set and policy in ('one', 'all', 'none'):
+        stmts_out = [] if policy == 'one' else list(stmts_in)
+    elif policy == 'one':
+        stmts_out = [st for st in stmts_in if has_any_source(st)]
+    elif policy == 'all':
+        stmts_out = [st for st in stmts_in if has_all_sources(st)]
+    elif policy == 'none':
+        stmts_out = [st for st in stmts_in if not has_any_source(st)]
+    else:
+        stmts_out = []
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1326,32 +1571,28 @@ def filter_inconsequential_mods(stmts_in, whitelist=None, **kwargs):
         whitelist = {}
     logger.info('Filtering %d statements to remove' % len(stmts_in) +
                 ' inconsequential modifications...')
-    states_used = whitelist
+    # The sites used are collected in sets which also removes duplicates
+    states_used = defaultdict(set)
+    for name, mods in whitelist.items():
+        states_used[name].update(mods)
     for stmt in stmts_in:
         for agent in stmt.agent_list():
-            if agent is not None:
-                if agent.mods:
-                    for mc in agent.mods:
-                        mod = (mc.mod_type, mc.residue, mc.position)
-                        try:
-                            states_used[agent.name].append(mod)
-                        except KeyError:
-                            states_used[agent.name] = [mod]
-    for k, v in states_used.items():
-        states_used[k] = list(set(v))
-    stmts_out = []
-    for stmt in stmts_in:
-        skip = False
-        if isinstance(stmt, Modification):
-            mod_type = modclass_to_modtype[stmt.__class__]
-            if isinstance(stmt, RemoveModification):
-                mod_type = modtype_to_inverse[mod_type]
-            mod = (mod_type, stmt.residue, stmt.position)
-            used = states_used.get(stmt.sub.name, [])
-            if mod not in used:
-                skip = True
-        if not skip:
-            stmts_out.append(stmt)
+            # The set of sites of each agent is looked up once and all its
+            # modification sites are added together
+            if agent is not None and agent.mods:
+                states_used[agent.name].update(
+                    (mc.mod_type, mc.residue, mc.position)
+                    for mc in agent.mods)
+
+    def mod_is_used(stmt):
+        mod_type = modclass_to_modtype[stmt.__class__]
+        if isinstance(stmt, RemoveModification):
+            mod_type = modtype_to_inverse[mod_type]
+        mod = (mod_type, stmt.residue, stmt.position)
+        return mod in states_used.get(stmt.sub.name, ())
+
+    stmts_out = [stmt for stmt in stmts_in
+                 if not isinstance(stmt, Modification) or mod_is_used(stmt)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1389,27 +1630,20 @@ def filter_inconsequential_acts(stmts_in, whitelist=None, **kwargs):
         whitelist = {}
     logger.info('Filtering %d statements to remove' % len(stmts_in) +
                 ' inconsequential activations...')
-    states_used = whitelist
+    # The activity types used are collected in sets as in
+    # filter_inconsequential_mods
+    states_used = defaultdict(set)
+    for name, acts in whitelist.items():
+        states_used[name].update(acts)
     for stmt in stmts_in:
         for agent in stmt.agent_list():
             if agent is not None:
                 if agent.activity:
                     act = agent.activity.activity_type
-                    try:
-                        states_used[agent.name].append(act)
-                    except KeyError:
-                        states_used[agent.name] = [act]
-    for k, v in states_used.items():
-        states_used[k] = list(set(v))
-    stmts_out = []
-    for stmt in stmts_in:
-        skip = False
-        if isinstance(stmt, RegulateActivity):
-            used = states_used.get(stmt.obj.name, [])
-            if stmt.obj_activity not in used:
-                skip = True
-        if not skip:
-            stmts_out.append(stmt)
+                    states_used[agent.name].add(act)
+    stmts_out = [stmt for stmt in stmts_in
+                 if not isinstance(stmt, RegulateActivity) or
+                 stmt.obj_activity in states_used.get(stmt.obj.name, ())]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1418,33 +1652,42 @@ def filter_inconsequential_acts(stmts_in, whitelist=None, **kwargs):
 
 
 def get_unreachable_mods(stmts_in):
-    mods_set = {}
+    mods_set = defaultdict(set)
     for stmt in stmts_in:
         if isinstance(stmt, Modification):
             mod_type = modclass_to_modtype[stmt.__class__]
             if isinstance(stmt, RemoveModification):
                 mod_type = modtype_to_inverse[mod_type]
             mod = (mod_type, stmt.residue, stmt.position)
-            if stmt.sub.name not in mods_set:
-                mods_set[stmt.sub.name] = set([mod])
-            else:
-                mods_set[stmt.sub.name].add(mod)
-    unreachable_mods = {}
+            mods_set[stmt.sub.name].add(mod)
+    unreachable_mods = defaultdict(set)
     for stmt in stmts_in:
         for agent in stmt.agent_list():
             if agent is None or not agent.mods:
                 continue
-            for mc in agent.mods:
-                mod = (mc.mod_type, mc.residue, mc.position)
-                if mod not in mods_set.get(agent.name, []):
-                    msg = '%s not reachable for %s' % (mod, agent.name)
-                    logger.warning(msg)
-                    if agent.name not in unreachable_mods:
-                        unreachable_mods[agent.name] = set([mod])
-                    else:
-                        unreachable_mods[agent.name].add(mod)
-
-    return unreachable_mods
+            # The sites of the agent that no statement reaches are found
+            # with one set difference
+            agent_mods = {(mc.mod_type, mc.residue, mc.position)
+                          for mc in agent.mods}
+            unreachable = agent_mods - mods_set.get(agent.name, frozenset())
+            for mod in unreachable:
+                msg = '%s not reachable for %s' % (mod, agent.name)
+                logger.warning(msg)
+            if unreachable:
+                unreachable_mods[agent.name].update(unreachable)
+
+    return dict(unreachable_mods)
+
+
+def _agent_mutations_match(agent, mutations, deletions):
+    if agent.name in deletions:
+        return False
+    agent_muts = agent.mutations
+    if agent_muts:
+        muts = mutations.get(agent.name, ())
+        return all((mut.residue_from, mut.position, mut.residue_to) in muts
+                   for mut in agent_muts)
+    return True
 
 
 def filter_mutation_status(stmts_in, mutations, deletions, **kwargs):
@@ -1467,6 +1710,15 @@ def filter_mutation_status(stmts_in, mutations, deletions, **kwargs):
         A list of gene names that are deleted.
     save : Optional[str]
         The name of a pickle file to save the results (stmts_out) into.
+    remove_bound: Optional[bool]
+        If true, removes bound conditions whose agents are deleted or have
+        mutations not relevant for the given context. If false (default),
+        filters out statements with such bound conditions.
+    poolsize : Optional[int]
+        The number of worker processes to use to check statements. If None
+        (default), or if remove_bound is True, no parallelization is
+        performed. NOTE: Parallelization is only available on Python 3.4 and
+        above.
 
     Returns
     -------
@@ -1474,39 +1726,18 @@ def filter_mutation_status(stmts_in, mutations, deletions, **kwargs):
         A list of filtered statements.
     """
 
-    if 'remove_bound' in kwargs and kwargs['remove_bound']:
-        remove_bound = True
-    else:
-        remove_bound = False
-
-    def criterion(agent):
-        if agent is not None and agent.name in deletions:
-            return False
-        if agent is not None and agent.mutations:
-            muts = mutations.get(agent.name, [])
-            for mut in agent.mutations:
-                mut_tup = (mut.residue_from, mut.position, mut.residue_to)
-                if mut_tup not in muts:
-                    return False
-        return True
-
-
+    remove_bound = kwargs.get('remove_bound', False)
     logger.info('Filtering %d statements for mutation status...' %
                 len(stmts_in))
-    stmts_out = []
-    for stmt in stmts_in:
-        skip = False
-        for agent in stmt.agent_list():
-            if not criterion(agent):
-                skip = True
-                break
-            if remove_bound:
-                _remove_bound_conditions(agent, criterion)
-            elif _any_bound_condition_fails_criterion(agent, criterion):
-                skip = True
-                break
-        if not skip:
-            stmts_out.append(stmt)
+    # The mutations and deletions are converted into sets once here since
+    # they are checked for every agent
+    mutations = {gene: frozenset(muts) for gene, muts in mutations.items()}
+    deletions = frozenset(deletions)
+    criterion = partial(_agent_mutations_match, mutations=mutations,
+                        deletions=deletions)
+    stmts_out = _filter_agents_meet_criterion(stmts_in, criterion,
+                                              remove_bound,
+                                              kwargs.get('poolsize'))
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1514,6 +1745,24 @@ def filter_mutation_status(stmts_in, mutations, deletions, **kwargs):
     return stmts_out
 
 
+@lru_cache(maxsize=None)
+def _get_kinase_names():
+    # The resource table is read once and kept as a set of gene names
+    path = os.path.dirname(os.path.abspath(__file__))
+    kinase_table = read_unicode_csv(path + '/../resources/kinases.tsv',
+                                    delimiter='\t', skiprows=1)
+    return frozenset(lin[1] for lin in kinase_table)
+
+
+@lru_cache(maxsize=None)
+def _get_transcription_factor_names():
+    path = os.path.dirname(os.path.abspath(__file__))
+    tf_table = \
+        read_unicode_csv(path + '/../resources/transcription_factors.csv',
+                         skiprows=1)
+    return frozenset(lin[1] for lin in tf_table)
+
+
 def filter_enzyme_kinase(stmts_in, **kwargs):
     """Filter Phosphorylations to ones where the enzyme is a known kinase.
 
@@ -1531,18 +1780,10 @@ def filter_enzyme_kinase(stmts_in, **kwargs):
     """
     logger.info('Filtering %d statements to remove ' % len(stmts_in) +
                 'phosphorylation by non-kinases...')
-    path = os.path.dirname(os.path.abspath(__file__))
-    kinase_table = read_unicode_csv(path + '/../resources/kinases.tsv',
-                                    delimiter='\t')
-    gene_names = [lin[1] for lin in list(kinase_table)[1:]]
-    stmts_out = []
-    for st in stmts_in:
-        if isinstance(st, Phosphorylation):
-            if st.enz is not None:
-                if st.enz.name in gene_names:
-                    stmts_out.append(st)
-        else:
-            stmts_out.append(st)
+    gene_names = _get_kinase_names()
+    stmts_out = [st for st in stmts_in
+                 if not isinstance(st, Phosphorylation) or
+                 (st.enz is not None and st.enz.name in gene_names)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1567,19 +1808,11 @@ def filter_mod_nokinase(stmts_in, **kwargs):
     """
     logger.info('Filtering %d statements to remove ' % len(stmts_in) +
                 'non-phospho modifications by kinases...')
-    path = os.path.dirname(os.path.abspath(__file__))
-    kinase_table = read_unicode_csv(path + '/../resources/kinases.tsv',
-                                    delimiter='\t')
-    gene_names = [lin[1] for lin in list(kinase_table)[1:]]
-    stmts_out = []
-    for st in stmts_in:
-        if isinstance(st, Modification) and not \
-           isinstance(st, Phosphorylation):
-            if st.enz is not None:
-                if st.enz.name not in gene_names:
-                    stmts_out.append(st)
-        else:
-            stmts_out.append(st)
+    gene_names = _get_kinase_names()
+    stmts_out = [st for st in stmts_in
+                 if not isinstance(st, Modification) or
+                 isinstance(st, Phosphorylation) or
+                 (st.enz is not None and st.enz.name not in gene_names)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1604,18 +1837,10 @@ def filter_transcription_factor(stmts_in, **kwargs):
     """
     logger.info('Filtering %d statements to remove ' % len(stmts_in) +
                 'amount regulations by non-transcription-factors...')
-    path = os.path.dirname(os.path.abspath(__file__))
-    tf_table = \
-        read_unicode_csv(path + '/../resources/transcription_factors.csv')
-    gene_names = [lin[1] for lin in list(tf_table)[1:]]
-    stmts_out = []
-    for st in stmts_in:
-        if isinstance(st, RegulateAmount):
-            if st.subj is not None:
-                if st.subj.name in gene_names:
-                    stmts_out.append(st)
-        else:
-            stmts_out.append(st)
+    gene_names = _get_transcription_factor_names()
+    stmts_out = [st for st in stmts_in
+                 if not isinstance(st, RegulateAmount) or
+                 (st.subj is not None and st.subj.name in gene_names)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1646,14 +1871,11 @@ def filter_uuid_list(stmts_in, uuids, **kwargs):
     invert = kwargs.get('invert', False)
     logger.info('Filtering %d statements for %d UUID%s...' %
                 (len(stmts_in), len(uuids), 's' if len(uuids) > 1 else ''))
-    stmts_out = []
-    for st in stmts_in:
-        if not invert:
-            if st.uuid in uuids:
-                stmts_out.append(st)
-        else:
-            if st.uuid not in uuids:
-                stmts_out.append(st)
+    uuid_set = frozenset(uuids)
+    if not invert:
+        stmts_out = [st for st in stmts_in if st.uuid in uuid_set]
+    else:
+        stmts_out = [st for st in stmts_in if st.uuid not in uuid_set]
 
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
@@ -1704,7 +1926,9 @@ def reduce_activities(stmts_in, **kwargs):
         A list of reduced activity statements.
     """
     logger.info('Reducing activities on %d statements...' % len(stmts_in))
-    stmts_out = [deepcopy(st) for st in stmts_in]
+    # Reducing activities only changes activity types on the statements and
+    # on the activity conditions of their agents
+    stmts_out = [_copy_stmt_with_agents(st) for st in stmts_in]
     ml = MechLinker(stmts_out)
     ml.gather_explicit_activities()
     ml.reduce_activities()
@@ -1733,7 +1957,7 @@ def strip_agent_context(stmts_in, **kwargs):
     logger.info('Stripping agent context on %d statements...' % len(stmts_in))
     stmts_out = []
     for st in stmts_in:
-        new_st = deepcopy(st)
+        new_st = _copy_stmt_with_agents(st)
         for agent in new_st.agent_list():
             if agent is None:
                 continue
@@ -1762,12 +1986,12 @@ def standardize_names_groundings(stmts):
             db_ns, db_id = concept.get_grounding()
             if db_id is not None:
                 if isinstance(db_id, list):
-                    db_id = db_id[0][0].split('/')[-1]
+                    db_id = db_id[0][0].rsplit('/', 1)[-1]
                 else:
-                    db_id = db_id.split('/')[-1]
-                db_id = db_id.replace('|', ' ')
-                db_id = db_id.replace('_', ' ')
-                db_id = db_id.replace('ONT::', '')
+                    db_id = db_id.rsplit('/', 1)[-1]
+                db_id = db_id.translate(_grounding_separators)
+                if 'ONT::' in db_id:
+                    db_id = db_id.replace('ONT::', '')
                 db_id = db_id.capitalize()
                 concept.name = db_id
     return stmts
@@ -1783,9 +2007,8 @@ def dump_stmt_strings(stmts, fname):
     fname : Optional[str]
         The name of a text file to save the printed statements into.
     """
-    with open(fname, 'wb') as fh:
-        for st in stmts:
-            fh.write(('%s\n' % st).encode('utf-8'))
+    with open(fname, 'wb', buffering=_pickle_buffer_size) as fh:
+        fh.writelines(('%s\n' % st).encode('utf-8') for st in stmts)
 
 
 def rename_db_ref(stmts_in, ns_from, ns_to, **kwargs):
@@ -1813,7 +2036,7 @@ def rename_db_ref(stmts_in, ns_from, ns_to, **kwargs):
     """
     logger.info('Remapping "%s" to "%s" in db_refs on %d statements...' %
                 (ns_from, ns_to, len(stmts_in)))
-    stmts_out = [deepcopy(st) for st in stmts_in]
+    stmts_out = [_copy_stmt_with_agents(st) for st in stmts_in]
     for stmt in stmts_out:
         for agent in stmt.agent_list():
             if agent is not None and ns_from in agent.db_refs:
@@ -1835,7 +2058,7 @@ def align_statements(stmts1, stmts2, keyfun=None):
         A list of INDRA Statements to align
     keyfun : Optional[function]
         A function that takes a Statement as an argument
-        and returns a key to align by. If not given,
+        and returns a hashable key to align by. If not given,
         the default key function is a tuble of the names
         of the Agents in the Statement.
 
@@ -1848,25 +2071,27 @@ def align_statements(stmts1, stmts2, keyfun=None):
         of the stmts2 list. If a given element is not matched,
         its corresponding pair in the tuple is None.
     """
+    def agent_name(agent):
+        return agent.name if agent is not None else None
+
     def name_keyfun(stmt):
-        return tuple(a.name if a is not None else None for
-                     a in stmt.agent_list())
+        return tuple(map(agent_name, stmt.agent_list()))
     if not keyfun:
         keyfun = name_keyfun
     matches = []
     keys1 = [keyfun(s) for s in stmts1]
     keys2 = [keyfun(s) for s in stmts2]
+    # Each key is mapped to the first statement in stmts2 that has it, and
+    # the keys of stmts1 are kept in a set, instead of searching the lists
+    # of keys for every statement
+    first_stmts2 = {}
+    for stmt, key in zip(stmts2, keys2):
+        first_stmts2.setdefault(key, stmt)
+    keys1_set = set(keys1)
     for stmt, key in zip(stmts1, keys1):
-        try:
-            match_idx = keys2.index(key)
-            match_stmt = stmts2[match_idx]
-            matches.append((stmt, match_stmt))
-        except ValueError:
-            matches.append((stmt, None))
+        matches.append((stmt, first_stmts2.get(key)))
     for stmt, key in zip(stmts2, keys2):
-        try:
-            match_idx = keys1.index(key)
-        except ValueError:
+        if key not in keys1_set:
             matches.append((None, stmt))
     return matches
 
@@ -1,26 +1,32 @@
+from operator import itemgetter
 from collections import defaultdict
 from itertools import permutations
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
 
 from indra.assemblers.english import EnglishAssembler
 from indra.statements import Agent, get_statement_by_name
 
 
-def _get_keyed_stmts(stmt_list):
+def _get_keyed_stmts(stmt_list, pairwise_complex=True):
     def name(agent):
         return 'None' if agent is None else agent.name
 
     for s in stmt_list:
         # Create a key.
-        verb = s.__class__.__name__
+        verb = type(s).__name__
         key = (verb,)
         ags = s.agent_list()
         if verb == 'Complex':
-            ag_ns = {name(ag) for ag in ags}
-            if 1 < len(ag_ns) < 6:
-                for pair in permutations(ag_ns, 2):
-                    yield key + tuple(pair),  s
-            if len(ag_ns) == 2:
-                continue
+            ag_ns = set(map(name, ags))
+            if pairwise_complex:
+                if 1 < len(ag_ns) < 6:
+                    for pair in permutations(ag_ns, 2):
+                        yield key + tuple(pair),  s
+                if len(ag_ns) == 2:
+                    continue
             key += tuple(sorted(ag_ns))
         elif verb == 'Conversion':
             subj = name(s.subj)
@@ -32,12 +38,13 @@ def _get_keyed_stmts(stmt_list):
         elif verb == 'HasActivity':
             key += (name(ags[0]), s.activity, s.has_activity)
         else:
-            key += tuple([name(ag) for ag in ags])
+            key += tuple(map(name, ags))
 
         yield key, s
 
 
-def group_and_sort_statements(stmt_list, ev_totals=None):
+def group_and_sort_statements(stmt_list, ev_totals=None,
+                              pairwise_complex=True):
     """Group statements by type and arguments, and sort by prevalence.
 
     Parameters
@@ -48,6 +55,12 @@ def group_and_sort_statements(stmt_list, ev_totals=None):
         A dictionary, keyed by statement hash (shallow) with counts of total
         evidence as the values. Including this will allow statements to be
         better sorted.
+    pairwise_complex : Optional[bool]
+        If True, Complexes with up to 5 agents are also grouped under each
+        ordered pair of their agents, so that they lend weight to other
+        statements between those agents. If False, each Complex is only
+        grouped under all of its agents, which is much faster for large
+        Complexes. Default: True
 
     Returns
     -------
@@ -58,23 +71,31 @@ def group_and_sort_statements(stmt_list, ev_totals=None):
         arguments (normalized strings), the count of statements with those
         arguements and type, and then the statement type.
     """
+    # The counts are cached since statements are counted once for each of
+    # their keys and again when sorted, and hashing a statement is costly.
+    stmt_ev_counts = {}
+
     def _count(stmt):
-        sh = stmt.get_hash()
-        if ev_totals is None or sh not in ev_totals:
-            return len(stmt.evidence)
-        else:
-            return ev_totals[sh]
+        count = stmt_ev_counts.get(id(stmt))
+        if count is None:
+            if ev_totals is None:
+                count = len(stmt.evidence)
+            else:
+                count = ev_totals.get(stmt.get_hash(), len(stmt.evidence))
+            stmt_ev_counts[id(stmt)] = count
+        return count
 
     stmt_rows = defaultdict(list)
-    stmt_counts = defaultdict(lambda: 0)
-    arg_counts = defaultdict(lambda: 0)
-    for key, s in _get_keyed_stmts(stmt_list):
+    stmt_counts = defaultdict(int)
+    arg_counts = defaultdict(int)
+    for key, s in _get_keyed_stmts(stmt_list, pairwise_complex):
         # Update the counts, and add key if needed.
         stmt_rows[key].append(s)
 
         # Keep track of the total evidence counts for this statement and the
         # arguments.
-        stmt_counts[key] += _count(s)
+        count = _count(s)
+        stmt_counts[key] += count
 
         # Add up the counts for the arguments, pairwise for Complexes and
         # Conversions. This allows, for example, a complex between MEK, ERK,
@@ -83,9 +104,24 @@ def group_and_sort_statements(stmt_list, ev_totals=None):
         if key[0] == 'Conversion':
             subj = key[1]
             for obj in key[2] + key[3]:
-                arg_counts[(subj, obj)] += _count(s)
+                arg_counts[(subj, obj)] += count
         else:
-            arg_counts[key[1:]] += _count(s)
+            arg_counts[key[1:]] += count
+
+    # The number of distinct agent names of each Complex, which is needed
+    # for every pair of its agents, is only counted once.
+    complex_name_counts = {}
+
+    def _num_names(stmt):
+        num = complex_name_counts.get(id(stmt))
+        if num is None:
+            num = len({ag.name for ag in stmt.agent_list()})
+            complex_name_counts[id(stmt)] = num
+        return num
+
+    # Statements with more evidence, and then fewer agents, come first.
+    def _sort_value(stmt):
+        return _count(stmt) + 1/(1+len(stmt.agent_list()))
 
     # Sort the rows by count and agent names.
     def process_rows(stmt_rows):
@@ -95,21 +131,24 @@ def group_and_sort_statements(stmt_list, ev_totals=None):
             sub_count = stmt_counts[key]
             arg_count = arg_counts[inps]
             if verb == 'Complex' and sub_count == arg_count and len(inps) <= 2:
-                if all([len(set(ag.name for ag in s.agent_list())) > 2
-                        for s in stmts]):
+                if all(_num_names(s) > 2 for s in stmts):
                     continue
             new_key = (arg_count, inps, sub_count, verb)
-            stmts = sorted(stmts,
-                           key=lambda s: _count(s) + 1/(1+len(s.agent_list())),
-                           reverse=True)
+            stmts = sorted(stmts, key=_sort_value, reverse=True)
             yield new_key, verb, stmts
 
-    sorted_groups = sorted(process_rows(stmt_rows),
-                           key=lambda tpl: tpl[0], reverse=True)
+    sorted_groups = sorted(process_rows(stmt_rows), key=itemgetter(0),
+                           reverse=True)
 
     return sorted_groups
 
 
+@lru_cache(maxsize=None)
+def _get_statement_class(verb):
+    # Looking up a class by name walks the whole hierarchy of statements
+    return get_statement_by_name(verb)
+
+
 def make_stmt_from_sort_key(key, verb):
     """Make a Statement from the sort key.
 
@@ -120,7 +159,7 @@ def make_stmt_from_sort_key(key, verb):
             return None
         return Agent(name)
 
-    StmtClass = get_statement_by_name(verb)
+    StmtClass = _get_statement_class(verb)
     inps = list(key[1])
     if verb == 'Complex':
         stmt = StmtClass([make_agent(name) for name in inps])
@@ -146,12 +185,27 @@ def make_string_from_sort_key(key, verb):
 
     Specifically, the sort key used by `group_and_sort_statements`.
     """
-    stmt = make_stmt_from_sort_key(key, verb)
+    # Only the arguments of the key and the verb determine the string
+    try:
+        return _make_string_from_sort_args(tuple(key[1]), verb)
+    # The arguments of Conversions can be given as nested lists which can't
+    # be cached
+    except TypeError:
+        stmt = make_stmt_from_sort_key(key, verb)
+        return stmt_to_english(stmt)
+
+
+@lru_cache(maxsize=4096)
+def _make_string_from_sort_args(inps, verb):
+    stmt = make_stmt_from_sort_key((None, inps), verb)
     return stmt_to_english(stmt)
 
 
 def get_simplified_stmts(stmts):
     simple_stmts = []
-    for key, s in _get_keyed_stmts(stmts):
-        simple_stmts.append(make_stmt_from_sort_key(key, s.__class__.__name__))
+    for key, _ in _get_keyed_stmts(stmts):
+        # The key starts with the verb of the statement, followed by the
+        # arguments which are the second element of a sort key.
+        sort_key = (None, key[1:])
+        simple_stmts.append(make_stmt_from_sort_key(sort_key, key[0]))
     return simple_stmts